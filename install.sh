@@ -2,6 +2,10 @@
 
 SERVICE_NAME="neo-ai.service"
 INSTALL_DIR="/opt/neo_ai"
+# REQUIREMENTS=requirements-lite.txt ./install.sh -> tanpa torch (YOLO_BACKEND "ncnn")
+REQUIREMENTS="${REQUIREMENTS:-requirements.txt}"
+# APP_ARGS=--headless ./install.sh -> service tanpa GUI (capture, inference, serial)
+APP_ARGS="${APP_ARGS:-}"
 LOG_DIR="/var/log/neo_ai"
 
 echo "=== NEO AI Installer (Tanpa Virtual Environment) ==="
@@ -16,7 +20,7 @@ sudo cp -r ./* $INSTALL_DIR/
 
 # 3. Install dependencies Python global
 echo "[3/6] Menginstall dependencies Python..."
-sudo pip3 install -r requirements.txt
+sudo pip3 install -r $REQUIREMENTS
 
 # 4. Buat direktori log
 echo "[4/6] Membuat direktori log..."
@@ -33,7 +37,7 @@ After=network.target
 
 [Service]
 Type=simple
-ExecStart=/usr/bin/python3 $INSTALL_DIR/main.py
+ExecStart=/usr/bin/python3 $INSTALL_DIR/src/main.py $APP_ARGS
 Restart=always
 RestartSec=5
 WorkingDirectory=$INSTALL_DIR
@@ -0,0 +1,418 @@
+"""
+Benchmark pipeline penuh (capture -> inference -> lidar -> serial) dari
+video rekaman, dengan lidar dan MCU disimulasikan.
+
+    python script/benchmark.py --video videos/sample-large-1.MOV --skips 0,1,2,4
+
+Setiap kombinasi model (semua model di models/ untuk backend tersebut, atau
+--models) x FRAME_SKIP (0 = scheduler adaptif) dijalankan di proses
+terpisah agar peak RSS terukur per run. Hasil ditulis sebagai JSON ke
+logs/benchmark_<timestamp>.json (atau --output):
+
+    fps                   frame kamera yang dibaca pipeline per detik
+                          (sustained, setelah warm-up)
+    inference_fps         frame yang masuk model per detik
+    detection_rate        fraksi frame ter-inferensi yang punya deteksi
+    detection_to_serial   p50/p95/p99 ms dari frame di-capture sampai
+                          perintah ditulis ke MCU
+    peak_rss_mb           peak resident memory proses
+    config                config efektif run (config.json + override)
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from configs.config_manager import ConfigManager  # noqa: E402
+from controller.engine import available_models  # noqa: E402
+from controller.yolo import YOLOThreadController  # noqa: E402
+
+
+class SimulatedLidar:
+    """
+    Pengganti LidarController: kirim jarak pada rate tetap. Dengan peluang
+    `in_range` jarak berada di bawah threshold (pohon dalam jangkauan).
+    Seed tetap agar setiap run mendapat urutan jarak yang sama.
+    """
+
+    def __init__(self, callback, threshold, rate_hz=100, in_range=0.8, seed=0):
+        self.callback = callback
+        self.threshold = threshold
+        self.interval = 1.0 / rate_hz
+        self.in_range = in_range
+        self.random = random.Random(seed)
+        self.samples = 0
+        self._running = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while self._running:
+            if self.random.random() < self.in_range:
+                distance = self.random.uniform(0.2, 0.95) * self.threshold
+            else:
+                distance = self.random.uniform(1.05, 3.0) * self.threshold
+            self.callback({"distance_cm": int(distance), "strength": 0, "temp_c": 0})
+            self.samples += 1
+            time.sleep(self.interval)
+
+    def start(self):
+        self._running = True
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+
+
+class SimulatedMcu:
+    """
+    Pengganti SerialController: setiap perintah membuat MCU BUSY selama
+    `spray_ms` lalu READY lagi, seperti Arduino saat menyemprot.
+    """
+
+    def __init__(self, spray_ms=300):
+        self.spray_time = spray_ms / 1000.0
+        self.ser = self  # _send_serial_message memeriksa ser.is_open
+        self.is_open = True
+        self.is_busy = False
+        self._timer = None
+
+    def send(self, data, timestamp=None):
+        self.is_busy = True
+        self._timer = threading.Timer(self.spray_time, self._ready)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _ready(self):
+        self.is_busy = False
+
+    def stop(self):
+        self.is_open = False
+        if self._timer:
+            self._timer.cancel()
+
+
+class BenchmarkController(YOLOThreadController):
+    """YOLOThreadController headless dengan lidar/MCU simulasi dan counter."""
+
+    def __init__(self, overrides, args):
+        self.args = args
+        self.reset_counters()
+        super().__init__(headless=True, overrides=overrides)
+
+    def reset_counters(self):
+        self.inferred = 0
+        self.detected = 0
+        self.serial_sent = 0
+        self.serial_skipped_busy = 0
+
+    def _init_serial_controller(self):
+        self.serial_controller = SimulatedMcu(self.args.spray_ms)
+
+    def _init_lidar_controller(self):
+        self.lidar_left = SimulatedLidar(
+            self.update_left_distance,
+            self.lidar_threshold,
+            self.args.lidar_hz,
+            self.args.lidar_in_range,
+            seed=self.args.seed,
+        )
+        self.lidar_right = SimulatedLidar(
+            self.update_right_distance,
+            self.lidar_threshold,
+            self.args.lidar_hz,
+            self.args.lidar_in_range,
+            seed=self.args.seed + 1,
+        )
+        self.lidar_left.start()
+        self.lidar_right.start()
+
+    def captured_frames(self):
+        return sum(
+            camera.capture_thread.frame_count
+            for camera in self.cameras
+            if camera.capture_thread
+        )
+
+    def _process_detections(self, camera, frame, detections):
+        if detections is not None:
+            self.inferred += 1
+            self.detected += len(detections) > 0
+        super()._process_detections(camera, frame, detections)
+
+    def _send_serial_message(self, message, timestamp=None):
+        sent = super()._send_serial_message(message, timestamp)
+        if sent:
+            self.latency.record("detection_to_serial", time.monotonic() - timestamp)
+        return sent
+
+    def stop(self):
+        super().stop()
+        self.serial_controller.stop()
+        self.lidar_left.stop()
+        self.lidar_right.stop()
+
+
+def peak_rss_mb():
+    # ru_maxrss dalam KB di Linux, byte di macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1)
+
+
+def run_single(args):
+    """Satu kombinasi model x frame skip, dijalankan di proses anak."""
+    from PyQt5.QtCore import QCoreApplication
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    overrides = {
+        "YOLO_MODEL": args.model,
+        "YOLO_BACKEND": args.backend,
+        "FRAME_SKIP": args.skip,
+        "CAMERAS": [],
+        "SOURCE_TYPE": "file",
+        "SOURCE_PATH": args.video,
+        "REPLAY_MODE": "max" if args.max else "realtime",
+        "REPLAY_LOOP": bool(args.duration),
+        "REPLAY_START_S": 0.0,
+        "REPLAY_END_S": 0,
+        "LATENCY_WINDOW": 100000,
+        "LATENCY_LOG_INTERVAL_S": 0,
+    }
+    controller = BenchmarkController(overrides, args)
+    controller.setup()
+    controller.start()
+
+    # Waktu load model & warm-up tidak ikut diukur
+    while controller.engine is None and controller.isRunning():
+        time.sleep(0.05)
+    time.sleep(args.warmup)
+    controller.reset_counters()
+    controller.latency.reset()
+    lidar_samples = controller.lidar_left.samples + controller.lidar_right.samples
+    captured = controller.captured_frames()
+
+    started = time.monotonic()
+    while controller.isRunning() and not controller.sources_finished():
+        if args.duration and time.monotonic() - started >= args.duration:
+            break
+        time.sleep(0.1)
+    elapsed = time.monotonic() - started
+    frames = controller.captured_frames() - captured
+
+    loaded = controller.engine is not None
+    controller.stop()
+
+    latency = controller.latency.summary()
+    lidar_samples = (
+        controller.lidar_left.samples + controller.lidar_right.samples - lidar_samples
+    )
+    return {
+        "model": args.model,
+        "backend": args.backend,
+        "frame_skip": args.skip,
+        "ok": loaded,
+        "duration_s": round(elapsed, 2),
+        "frames": frames,
+        "fps": round(frames / elapsed, 2) if elapsed else 0.0,
+        "inference_fps": round(controller.inferred / elapsed, 2) if elapsed else 0.0,
+        "detection_rate": (
+            round(controller.detected / controller.inferred, 4)
+            if controller.inferred
+            else 0.0
+        ),
+        "serial_sent": controller.serial_sent,
+        "serial_skipped_busy": controller.serial_skipped_busy,
+        "lidar_hz": round(lidar_samples / elapsed / 2, 1) if elapsed else 0.0,
+        "detection_to_serial": latency.pop("detection_to_serial", None),
+        "stages": latency,
+        "peak_rss_mb": peak_rss_mb(),
+        # Config efektif run ini (config.json + override benchmark), agar
+        # IMG_SIZE, RECT_INFERENCE, FPS, thread, capture, dst. ikut tercatat
+        "model_imgsz": [list(camera.model_imgsz) for camera in controller.cameras],
+        "config": controller.configs,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def child_command(args, model, skip, output):
+    command = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--single",
+        "--output",
+        output,
+        "--model",
+        model,
+        "--skip",
+        str(skip),
+        "--video",
+        args.video,
+        "--backend",
+        args.backend,
+        "--duration",
+        str(args.duration),
+        "--warmup",
+        str(args.warmup),
+        "--spray-ms",
+        str(args.spray_ms),
+        "--lidar-hz",
+        str(args.lidar_hz),
+        "--lidar-in-range",
+        str(args.lidar_in_range),
+        "--seed",
+        str(args.seed),
+    ]
+    if args.max:
+        command.append("--max")
+    return command
+
+
+def run_suite(args):
+    models = args.models.split(",") if args.models else available_models(args.backend)
+    if not models:
+        sys.exit(f"No models for backend '{args.backend}' in models/")
+    skips = [int(skip) for skip in args.skips.split(",")]
+
+    results = []
+    for model in models:
+        for skip in skips:
+            print(f"[Benchmark] {model} ({args.backend}) FRAME_SKIP={skip}...")
+            with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+                output = f.name
+            try:
+                process = subprocess.run(
+                    child_command(args, model, skip, output),
+                    cwd=ROOT,  # ConfigManager & logger memakai path relatif
+                    stdout=None if args.verbose else subprocess.DEVNULL,
+                )
+                if process.returncode == 0:
+                    with open(output) as f:
+                        result = json.load(f)
+                else:
+                    result = {
+                        "model": model,
+                        "backend": args.backend,
+                        "frame_skip": skip,
+                        "ok": False,
+                        "returncode": process.returncode,
+                    }
+            finally:
+                os.remove(output)
+
+            results.append(result)
+            if result["ok"]:
+                serial = result["detection_to_serial"] or {}
+                print(
+                    f"[Benchmark] {result['fps']} fps, "
+                    f"{result['inference_fps']} inference fps, "
+                    f"detection rate {result['detection_rate']}, "
+                    f"p99 detection->serial {serial.get('p99')} ms, "
+                    f"peak RSS {result['peak_rss_mb']} MB"
+                )
+            else:
+                print("[Benchmark] Run failed")
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "machine": {
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "video": args.video,
+        "replay_mode": "max" if args.max else "realtime",
+        "simulation": {
+            "spray_ms": args.spray_ms,
+            "lidar_hz": args.lidar_hz,
+            "lidar_in_range": args.lidar_in_range,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    output = args.output or os.path.join(
+        ROOT, "logs", f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"Report saved to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pipeline benchmark on a recorded video with simulated lidar/MCU"
+    )
+    parser.add_argument("--video", required=True, help="recorded video file")
+    parser.add_argument(
+        "--backend",
+        default=ConfigManager(os.path.join(ROOT, "src", "configs", "config.json"))
+        .get_config("YOLO_BACKEND", "ultralytics"),
+        choices=["ultralytics", "ncnn", "onnxruntime", "openvino", "opencv"],
+    )
+    parser.add_argument("--models", help="comma separated, default: all in models/")
+    parser.add_argument(
+        "--skips", default="0,1,2,4", help="FRAME_SKIP values, 0 = adaptive"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=0,
+        help="seconds per run (video loops), 0 = one pass of the video",
+    )
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument(
+        "--max", action="store_true", help="replay as fast as possible, not realtime"
+    )
+    parser.add_argument("--spray-ms", type=float, default=300, help="MCU BUSY time")
+    parser.add_argument("--lidar-hz", type=float, default=100)
+    parser.add_argument("--lidar-in-range", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="report path, default logs/benchmark_*.json")
+    parser.add_argument("--verbose", action="store_true", help="show pipeline output")
+    # Internal: satu run di proses anak
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--model", help=argparse.SUPPRESS)
+    parser.add_argument("--skip", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    args.video = os.path.abspath(args.video)
+
+    if not args.single:
+        run_suite(args)
+        return
+
+    result = run_single(args)
+    with open(args.output, "w") as f:
+        json.dump(result, f)
+    # Thread capture/lidar daemon tidak perlu ditunggu
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
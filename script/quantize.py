@@ -0,0 +1,347 @@
+"""
+Post-training INT8 quantization dari frame lapangan.
+
+    python script/quantize.py --model medium_tree --backend ncnn --frames recordings/
+
+Frame dibagi menjadi set kalibrasi dan held-out. Set kalibrasi dipakai untuk
+menghitung skala INT8, hasilnya disimpan sebagai varian <name>_int8 di models/
+(layout sama dengan model float untuk backend tersebut). Set held-out dipakai
+untuk membandingkan deteksi model INT8 terhadap model float.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+from controller.engine import (  # noqa: E402
+    MODELS_DIR,
+    _static_shape,
+    create_engine,
+    model_path,
+)
+from utils.letterbox import inference_shape, letterbox  # noqa: E402
+from utils.tracker import greedy_match, iou_matrix  # noqa: E402
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+def list_frames(folder):
+    return sorted(
+        os.path.join(folder, file)
+        for file in os.listdir(folder)
+        if file.lower().endswith(IMAGE_EXTENSIONS)
+    )
+
+
+def split_frames(frames, holdout, seed=0):
+    """
+    Acak lalu bagi menjadi (kalibrasi, held-out). Held-out tidak pernah
+    mengambil semua frame: minimal satu frame tetap untuk kalibrasi.
+    """
+    frames = list(frames)
+    random.Random(seed).shuffle(frames)
+    count = max(1, int(len(frames) * holdout)) if holdout > 0 else 0
+    count = min(count, len(frames) - 1)
+    return frames[count:], frames[:count]
+
+
+def preprocess(path, imgsz):
+    """Sama dengan RawYoloEngine: letterbox -> RGB float32 NCHW 0..1"""
+    image = cv2.imread(path)
+    padded, _, _ = letterbox(image, imgsz)
+    return cv2.dnn.blobFromImage(padded, 1.0 / 255.0, swapRB=True)
+
+
+def static_input(input_shape, imgsz):
+    """
+    Model dengan input statis (mis. export default 640x640) hanya menerima
+    ukuran itu; frame di-letterbox ke sana, sama seperti RawYoloEngine.
+    """
+    if input_shape is None or tuple(input_shape) == tuple(imgsz):
+        return imgsz
+    print(f"Model input is static {input_shape[1]}x{input_shape[0]}, using it")
+    return tuple(input_shape)
+
+
+def copy_metadata(source_folder, target_folder):
+    metadata = os.path.join(source_folder, "metadata.yaml")
+    if os.path.exists(metadata):
+        shutil.copy(metadata, target_folder)
+
+
+class OnnxQuantizer:
+    """onnxruntime.quantization (QDQ, per-channel). Dipakai onnxruntime & opencv."""
+
+    def quantize(self, name, frames, imgsz):
+        import onnxruntime as ort
+        from onnxruntime.quantization import (
+            CalibrationDataReader,
+            QuantFormat,
+            QuantType,
+            quantize_static,
+        )
+
+        source = model_path(name, "onnxruntime")
+        target = model_path(f"{name}_int8", "onnxruntime")
+
+        session = ort.InferenceSession(source, providers=["CPUExecutionProvider"])
+        model_input = session.get_inputs()[0]
+        imgsz = static_input(_static_shape(model_input.shape[2:]), imgsz)
+
+        class FrameReader(CalibrationDataReader):
+            def __init__(self, input_name):
+                self.input_name = input_name
+                self.frames = iter(frames)
+
+            def get_next(self):
+                path = next(self.frames, None)
+                if path is None:
+                    return None
+                return {self.input_name: preprocess(path, imgsz)}
+
+        quantize_static(
+            source,
+            target,
+            FrameReader(model_input.name),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=True,
+        )
+        return target
+
+
+class OpenVinoQuantizer:
+    """NNCF post-training quantization untuk model OpenVINO IR."""
+
+    def quantize(self, name, frames, imgsz):
+        import nncf
+        import openvino as ov
+
+        source = model_path(name, "openvino")
+        target = model_path(f"{name}_int8", "openvino")
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+        model = ov.Core().read_model(source)
+        shape = model.input(0).get_partial_shape()
+        if shape[2].is_static and shape[3].is_static:
+            imgsz = static_input((shape[2].get_length(), shape[3].get_length()), imgsz)
+
+        dataset = nncf.Dataset(frames, lambda path: preprocess(path, imgsz))
+        quantized = nncf.quantize(
+            model,
+            dataset,
+            preset=nncf.QuantizationPreset.MIXED,
+            subset_size=len(frames),
+        )
+        ov.save_model(quantized, target)
+        copy_metadata(os.path.dirname(source), os.path.dirname(target))
+        return target
+
+
+class NcnnQuantizer:
+    """
+    Tool ncnn2table (kalibrasi KL) + ncnn2int8 dari build ncnn.
+    ncnn2table me-resize frame langsung ke input model (tanpa letterbox);
+    dengan rect inference ukurannya sama dengan frame yang dipakai app.
+    """
+
+    def __init__(self, tools_dir=None):
+        self.ncnn2table = self._find("ncnn2table", tools_dir)
+        self.ncnn2int8 = self._find("ncnn2int8", tools_dir)
+
+    def _find(self, tool, tools_dir):
+        path = shutil.which(tool, path=tools_dir)
+        if not path:
+            raise RuntimeError(
+                f"'{tool}' not found, build ncnn tools or pass --ncnn-tools"
+            )
+        return path
+
+    def quantize(self, name, frames, imgsz):
+        source = model_path(name, "ncnn")
+        target = model_path(f"{name}_int8", "ncnn")
+        os.makedirs(target, exist_ok=True)
+
+        param = os.path.join(source, "model.ncnn.param")
+        weights = os.path.join(source, "model.ncnn.bin")
+        height, width = imgsz
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_list = os.path.join(temp_dir, "images.txt")
+            table = os.path.join(temp_dir, "model.table")
+            with open(image_list, "w") as f:
+                f.write("\n".join(os.path.abspath(path) for path in frames))
+
+            scale = 1.0 / 255.0
+            subprocess.run(
+                [
+                    self.ncnn2table,
+                    param,
+                    weights,
+                    image_list,
+                    table,
+                    "mean=[0,0,0]",
+                    f"norm=[{scale},{scale},{scale}]",
+                    f"shape=[{width},{height},3]",
+                    "pixel=RGB",
+                    "thread=4",
+                    "method=kl",
+                ],
+                check=True,
+            )
+            subprocess.run(
+                [
+                    self.ncnn2int8,
+                    param,
+                    weights,
+                    os.path.join(target, "model.ncnn.param"),
+                    os.path.join(target, "model.ncnn.bin"),
+                    table,
+                ],
+                check=True,
+            )
+
+        copy_metadata(source, target)
+        return target
+
+
+def quantizer_for(backend, ncnn_tools=None):
+    if backend in ("ncnn", "ultralytics"):
+        return NcnnQuantizer(ncnn_tools)
+    if backend in ("onnxruntime", "opencv"):
+        return OnnxQuantizer()
+    if backend == "openvino":
+        return OpenVinoQuantizer()
+    raise ValueError(f"Unknown backend '{backend}'")
+
+
+def compare(float_engine, int8_engine, frames, imgsz, conf, iou_threshold=0.5):
+    """
+    Deteksi model float dianggap referensi. Deteksi INT8 dipasangkan per
+    class dengan IoU >= iou_threshold, lalu dihitung precision/recall/F1.
+    """
+    matched = reference = predicted = 0
+    ious, conf_delta = [], []
+    float_time = int8_time = 0.0
+
+    for path in frames:
+        image = cv2.imread(path)
+
+        started = time.perf_counter()
+        expected = float_engine.infer(image, imgsz, conf=conf)
+        float_time += time.perf_counter() - started
+
+        started = time.perf_counter()
+        actual = int8_engine.infer(image, imgsz, conf=conf)
+        int8_time += time.perf_counter() - started
+
+        iou = iou_matrix(expected.xyxy, actual.xyxy)
+        iou[expected.cls[:, None] != actual.cls[None, :]] = 0
+        pairs = greedy_match(iou, iou_threshold)
+
+        matched += len(pairs)
+        reference += len(expected)
+        predicted += len(actual)
+        for row, col in pairs:
+            ious.append(iou[row, col])
+            conf_delta.append(actual.conf[col] - expected.conf[row])
+
+    precision = matched / predicted if predicted else 1.0
+    recall = matched / reference if reference else 1.0
+    total = max(len(frames), 1)
+    return {
+        "frames": len(frames),
+        "float_detections": reference,
+        "int8_detections": predicted,
+        "precision": round(precision, 4),
+        "recall": round(recall, 4),
+        "f1": round(2 * precision * recall / max(precision + recall, 1e-9), 4),
+        "mean_iou": round(float(np.mean(ious)), 4) if ious else None,
+        "mean_conf_delta": round(float(np.mean(conf_delta)), 4) if conf_delta else None,
+        "float_ms": round(float_time / total * 1000, 2),
+        "int8_ms": round(int8_time / total * 1000, 2),
+        "speedup": round(float_time / int8_time, 2) if int8_time else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="INT8 calibration from recorded frames"
+    )
+    parser.add_argument("--model", required=True, help="e.g. medium_tree")
+    parser.add_argument(
+        "--backend",
+        default="ncnn",
+        choices=["ncnn", "ultralytics", "onnxruntime", "opencv", "openvino"],
+    )
+    parser.add_argument("--frames", required=True, help="folder of recorded frames")
+    parser.add_argument("--holdout", type=float, default=0.2)
+    parser.add_argument("--max-calib", type=int, default=300)
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--square", action="store_true", help="disable rect inference")
+    parser.add_argument("--conf", type=float, default=0.25)
+    parser.add_argument("--ncnn-tools", help="folder containing ncnn2table/ncnn2int8")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    frames = list_frames(args.frames)
+    if not frames:
+        sys.exit(f"No images found in {args.frames}")
+
+    calibration, holdout = split_frames(frames, args.holdout, args.seed)
+    calibration = calibration[: args.max_calib]
+    if not calibration:
+        sys.exit(
+            f"No calibration frames left ({len(frames)} images, "
+            f"--holdout {args.holdout}, --max-calib {args.max_calib})"
+        )
+
+    height, width = cv2.imread(frames[0]).shape[:2]
+    model_width, model_height = inference_shape(
+        width, height, args.imgsz, rect=not args.square
+    )
+    imgsz = (model_height, model_width)
+    print(
+        f"{len(calibration)} calibration / {len(holdout)} held-out frames, "
+        f"input {model_width}x{model_height}"
+    )
+
+    quantizer = quantizer_for(args.backend, args.ncnn_tools)
+    started = time.monotonic()
+    target = quantizer.quantize(args.model, calibration, imgsz)
+    print(f"Saved {target} ({time.monotonic() - started:.1f}s)")
+
+    if not holdout:
+        return
+
+    report = compare(
+        create_engine(args.backend, args.model),
+        create_engine(args.backend, f"{args.model}_int8"),
+        holdout,
+        imgsz,
+        args.conf,
+    )
+    report.update(model=args.model, backend=args.backend)
+
+    report_path = os.path.join(MODELS_DIR, f"{args.model}_int8_{args.backend}.json")
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=4)
+
+    print(json.dumps(report, indent=4))
+    print(f"Report saved to {report_path}")
+
+
+if __name__ == "__main__":
+    main()
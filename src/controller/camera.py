@@ -0,0 +1,118 @@
+import cv2
+import numpy as np
+
+from controller.capture import CaptureThread
+from controller.source import open_capture
+from utils.frame_buffer import BoundedQueue
+from utils.letterbox import capture_shape, inference_shape
+
+
+class CameraContext:
+    """
+    State pipeline milik satu kamera: capture, scheduler, tracker, zone
+    mapping dan spray registry. Engine inference, serial dan lidar dipakai
+    bersama oleh semua kamera; hasil deteksi dikembalikan ke context ini
+    lewat frame.camera.
+    """
+
+    def __init__(
+        self,
+        index,
+        source,
+        zone_mapper,
+        scheduler,
+        tracker=None,
+        spray_registry=None,
+        backend="auto",
+        pipeline=None,
+        source_type="camera",
+    ):
+        self.index = index
+        self.source = source
+        self.source_type = source_type
+        self.backend = backend
+        self.pipeline = pipeline
+        self.zone_mapper = zone_mapper
+        self.scheduler = scheduler
+        self.tracker = tracker
+        self.spray_registry = spray_registry
+
+        self.cap = None
+        self.capture_thread = None
+        self.render_queue = None
+        self.frame_shape = None
+        self.model_imgsz = None
+
+        self.latest_detections = None
+        self.zone_occupancy = np.zeros(len(zone_mapper.names), dtype=np.int64)
+
+    def open(
+        self, width, height, imgsz=640, rect=True, jpeg_decoder="opencv", replay=None
+    ):
+        """Buka sumber video dengan backend & resolusi capture yang diminta."""
+        self.cap = open_capture(
+            self.source,
+            self.backend,
+            width,
+            height,
+            pipeline=self.pipeline,
+            jpeg_decoder=jpeg_decoder,
+            replay=replay,
+            source_type=self.source_type,
+        )
+        if not self.cap.isOpened():
+            raise RuntimeError(
+                f"Camera {self.index}: cannot open {self.source!r} ({self.backend})"
+            )
+
+        self._init_inference_shape(width, height, imgsz, rect)
+
+        # Decode JPEG langsung di skala terdekat >= ukuran frame pipeline
+        if hasattr(self.cap, "set_target_size"):
+            self.cap.set_target_size(*self.frame_shape)
+
+    def _init_inference_shape(self, width, height, imgsz, rect):
+        """
+        Tentukan ukuran input model dari resolusi yang benar-benar diberikan
+        kamera / video, sehingga frame cukup di-resize satu kali di capture.
+        """
+        width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or width
+        height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or height
+
+        self.frame_shape = capture_shape(width, height, imgsz, rect)
+        model_width, model_height = inference_shape(width, height, imgsz, rect)
+        self.model_imgsz = (model_height, model_width)
+
+        print(
+            f"[Camera {self.index}] capture {width}x{height} -> frame "
+            f"{self.frame_shape[0]}x{self.frame_shape[1]} -> model "
+            f"{model_width}x{model_height}"
+        )
+
+    def create_capture(self, batcher, display=False, cpus=None, latency=None):
+        """Capture ke batcher inference, dan ke render queue jika ditampilkan."""
+        outputs = [batcher]
+        if display:
+            self.render_queue = BoundedQueue(maxsize=2)
+            outputs.insert(0, self.render_queue)
+
+        self.capture_thread = CaptureThread(
+            self.cap,
+            outputs=outputs,
+            resize_to=self.frame_shape,
+            cpus=cpus,
+            camera=self.index,
+            latency=latency,
+        )
+
+    def stats(self):
+        stats = {"scheduler": self.scheduler.stats()}
+        if self.capture_thread:
+            stats["capture"] = self.capture_thread.stats()
+        return stats
+
+    def stop(self):
+        if self.capture_thread:
+            self.capture_thread.stop()
+        elif self.cap:
+            self.cap.release()
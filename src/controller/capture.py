@@ -0,0 +1,79 @@
+import threading
+import time
+
+import cv2
+
+from utils.affinity import pin_current_thread
+
+
+class Frame:
+    __slots__ = ("index", "timestamp", "image", "camera")
+
+    def __init__(self, index, timestamp, image, camera=0):
+        self.index = index
+        self.timestamp = timestamp  # time.monotonic() saat frame dibaca
+        self.image = image
+        self.camera = camera  # index kamera (multi-camera)
+
+
+class CaptureThread(threading.Thread):
+    """
+    Baca frame terus-menerus dari VideoCapture ke semua output queue.
+    resize_to (width, height): downscale satu kali ke ukuran input model,
+    sehingga stage berikutnya tidak perlu resize lagi.
+    """
+
+    def __init__(
+        self, cap, outputs, resize_to=None, cpus=None, camera=0, latency=None
+    ):
+        super().__init__(name=f"capture-{camera}", daemon=True)
+        self.cap = cap
+        self.camera = camera
+        self.latency = latency  # LatencyRecorder, stage "read" & "resize"
+        self.outputs = outputs
+        self.resize_to = tuple(resize_to) if resize_to else None
+        self.cpus = cpus
+        self.frame_count = 0
+        self.finished = False  # sumber replay sudah habis
+        self._running = False
+
+    def run(self):
+        self._running = True
+        pin_current_thread(self.cpus)
+
+        while self._running:
+            started = time.monotonic()
+            ret, image = self.cap.read()
+            if not ret:
+                if getattr(self.cap, "finished", False):
+                    self.finished = True
+                    break
+                time.sleep(0.01)
+                continue
+
+            timestamp = time.monotonic()
+
+            if self.resize_to and image.shape[1::-1] != self.resize_to:
+                image = cv2.resize(image, self.resize_to, interpolation=cv2.INTER_AREA)
+                if self.latency:
+                    self.latency.record("resize", time.monotonic() - timestamp)
+
+            # read termasuk menunggu frame berikutnya dari kamera / replay
+            if self.latency:
+                self.latency.record("read", timestamp - started)
+
+            self.frame_count += 1
+            frame = Frame(self.frame_count, timestamp, image, self.camera)
+            for queue in self.outputs:
+                queue.put(frame)
+
+    def stats(self):
+        return {"processed": self.frame_count}
+
+    def stop(self):
+        """Stop capture thread dan release kamera."""
+        self._running = False
+        if self.is_alive():
+            self.join(timeout=1.0)
+        if self.cap:
+            self.cap.release()
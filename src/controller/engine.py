@@ -0,0 +1,420 @@
+import ast
+import os
+
+import cv2
+import numpy as np
+
+from utils.detection import Detections
+from utils.letterbox import letterbox
+from utils.yolo_output import decode_predictions
+
+MODELS_DIR = "models"
+
+
+class InferenceEngine:
+    """
+    Interface engine inference. Setiap backend menerima frame BGR dan
+    mengembalikan Detections (array NumPy ringkas) pada koordinat frame,
+    sehingga pipeline tidak perlu tahu runtime apa yang dipakai.
+    """
+
+    backend = None
+
+    def __init__(self, model_name, threads=0):
+        """threads: jumlah thread intra-op, 0 = default runtime."""
+        self.model_name = model_name
+        self.threads = threads
+        self.names = {}
+
+    def infer(self, image, imgsz, conf=0.25, iou=0.45, timestamp=0.0):
+        """imgsz: (height, width) input model."""
+        raise NotImplementedError
+
+    def infer_batch(self, images, imgsz, conf=0.25, iou=0.45, timestamps=None):
+        """
+        Inference beberapa frame berukuran sama, return list Detections.
+        Default: satu per satu; backend yang mendukung batch menimpa ini.
+        """
+        timestamps = timestamps or [0.0] * len(images)
+        return [
+            self.infer(image, imgsz, conf, iou, timestamp)
+            for image, timestamp in zip(images, timestamps)
+        ]
+
+    def warmup(self, imgsz, runs=3):
+        """Beberapa inference dummy agar inference pertama tidak cold."""
+        height, width = imgsz
+        dummy = np.zeros((height, width, 3), dtype=np.uint8)
+        for _ in range(runs):
+            self.infer(dummy, imgsz)
+
+
+class UltralyticsEngine(InferenceEngine):
+    """
+    Model NCNN lewat ultralytics. Runtime NCNN ultralytics hanya menjalankan
+    gambar pertama dari batch, jadi infer_batch tetap satu per satu (default).
+    """
+
+    backend = "ultralytics"
+
+    def __init__(self, model_name, threads=0):
+        super().__init__(model_name, threads)
+        import torch
+        from ultralytics import YOLO
+
+        if threads:
+            torch.set_num_threads(threads)
+        self.threads = torch.get_num_threads()
+
+        self.model = YOLO(model_path(model_name, self.backend))
+        self.names = self.model.names
+
+    def infer(self, image, imgsz, conf=0.25, iou=0.45, timestamp=0.0):
+        results = self.model.predict(
+            image,
+            verbose=False,
+            imgsz=list(imgsz),
+            conf=conf,
+            iou=iou,
+            device="cpu",
+        )
+        return Detections.from_ultralytics(results[0], timestamp)
+
+class RawYoloEngine(InferenceEngine):
+    """
+    Basis backend yang menjalankan graph YOLO mentah:
+    letterbox -> forward -> decode + NMS di NumPy.
+    input_shape diisi jika model di-export dengan ukuran input statis,
+    dynamic_batch jika dimensi batch model dinamis (export dynamic=True).
+    """
+
+    input_shape = None
+    dynamic_batch = False
+
+    def infer(self, image, imgsz, conf=0.25, iou=0.45, timestamp=0.0):
+        shape = self.input_shape or tuple(imgsz)
+        padded, ratio, pad = letterbox(image, shape)
+        output = np.asarray(self._forward(self._blob([padded])))
+        xyxy, scores, cls = decode_predictions(
+            output, conf, iou, ratio, pad, image.shape
+        )
+        return Detections(xyxy, scores, cls, self.names, timestamp)
+
+    def infer_batch(self, images, imgsz, conf=0.25, iou=0.45, timestamps=None):
+        if not self.dynamic_batch or len(images) == 1:
+            return super().infer_batch(images, imgsz, conf, iou, timestamps)
+
+        timestamps = timestamps or [0.0] * len(images)
+        shape = self.input_shape or tuple(imgsz)
+        letterboxed = [letterbox(image, shape) for image in images]
+        outputs = np.asarray(self._forward(self._blob([lb[0] for lb in letterboxed])))
+
+        batch = []
+        for output, (_, ratio, pad), image, timestamp in zip(
+            outputs, letterboxed, images, timestamps
+        ):
+            xyxy, scores, cls = decode_predictions(
+                output, conf, iou, ratio, pad, image.shape
+            )
+            batch.append(Detections(xyxy, scores, cls, self.names, timestamp))
+        return batch
+
+    def _blob(self, images):
+        """List BGR uint8 HWC -> RGB float32 NCHW 0..1"""
+        return cv2.dnn.blobFromImages(images, 1.0 / 255.0, swapRB=True)
+
+    def _forward(self, blob):
+        raise NotImplementedError
+
+
+class OnnxRuntimeEngine(RawYoloEngine):
+    backend = "onnxruntime"
+
+    def __init__(self, model_name, threads=0):
+        super().__init__(model_name, threads)
+        ort = _require("onnxruntime", self.backend)
+
+        options = ort.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+            options.inter_op_num_threads = 1
+
+        path = model_path(model_name, self.backend)
+        self.session = ort.InferenceSession(
+            path, options, providers=["CPUExecutionProvider"]
+        )
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.input_shape = _static_shape(model_input.shape[2:])
+        self.dynamic_batch = not isinstance(model_input.shape[0], int)
+
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        self.names = parse_names(metadata.get("names")) or load_names(path)
+
+    def _forward(self, blob):
+        return self.session.run(None, {self.input_name: blob})[0]
+
+
+class OpenVinoEngine(RawYoloEngine):
+    backend = "openvino"
+
+    def __init__(self, model_name, threads=0):
+        super().__init__(model_name, threads)
+        ov = _require("openvino", self.backend)
+
+        path = model_path(model_name, self.backend)
+        core = ov.Core()
+        model = core.read_model(path)
+
+        shape = model.input(0).get_partial_shape()
+        if shape[2].is_static and shape[3].is_static:
+            self.input_shape = (shape[2].get_length(), shape[3].get_length())
+        self.dynamic_batch = shape[0].is_dynamic
+
+        config = {"INFERENCE_NUM_THREADS": threads} if threads else {}
+        self.compiled = core.compile_model(model, "CPU", config)
+        self.output = self.compiled.output(0)
+        self.threads = self.compiled.get_property("INFERENCE_NUM_THREADS")
+        self.names = load_names(path)
+
+    def _forward(self, blob):
+        return self.compiled([blob])[self.output]
+
+
+class NcnnEngine(RawYoloEngine):
+    """
+    Jalankan folder <name>_ncnn_model (model.ncnn.param/.bin) langsung
+    dengan binding ncnn, tanpa ultralytics/torch. Cocok untuk Raspberry Pi.
+    """
+
+    backend = "ncnn"
+    input_blob = "in0"
+    output_blob = "out0"
+
+    def __init__(self, model_name, threads=0):
+        super().__init__(model_name, threads)
+        self.ncnn = _require("ncnn", self.backend)
+
+        folder = model_path(model_name, self.backend)
+        param = os.path.join(folder, "model.ncnn.param")
+        weights = os.path.join(folder, "model.ncnn.bin")
+        for path in (param, weights):
+            if not os.path.exists(path):
+                raise FileNotFoundError(path)
+
+        self.net = self.ncnn.Net()
+        self.net.opt.use_vulkan_compute = False
+        if threads:
+            self.net.opt.num_threads = threads
+        self.threads = self.net.opt.num_threads
+        if self.net.load_param(param) != 0 or self.net.load_model(weights) != 0:
+            raise RuntimeError(f"ncnn failed to load {folder}")
+        self.names = load_names(folder)
+
+    def _forward(self, blob):
+        # ncnn tidak punya dimensi batch: input CHW, output (4 + nc, anchors)
+        with self.net.create_extractor() as extractor:
+            extractor.input(self.input_blob, self.ncnn.Mat(blob[0]))
+            _, output = extractor.extract(self.output_blob)
+        return np.array(output)
+
+
+class OpenCVDnnEngine(RawYoloEngine):
+    """
+    OpenCV DNN membaca file ONNX yang sama dengan onnxruntime. Ukuran input
+    statis dibaca langsung dari file ONNX (OpenCV tidak menyediakannya).
+    """
+
+    backend = "opencv"
+
+    def __init__(self, model_name, threads=0):
+        super().__init__(model_name, threads)
+
+        path = model_path(model_name, self.backend)
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+
+        # cv2.setNumThreads berlaku global untuk seluruh fungsi OpenCV
+        if threads:
+            cv2.setNumThreads(threads)
+        self.threads = cv2.getNumThreads()
+
+        self.input_shape = _static_shape(onnx_input_dims(path)[2:])
+        self.net = cv2.dnn.readNetFromONNX(path)
+        self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+        self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+        self.names = load_names(path)
+
+    def _forward(self, blob):
+        self.net.setInput(blob)
+        return self.net.forward()
+
+
+ENGINES = {
+    engine.backend: engine
+    for engine in (
+        UltralyticsEngine,
+        OnnxRuntimeEngine,
+        OpenVinoEngine,
+        NcnnEngine,
+        OpenCVDnnEngine,
+    )
+}
+
+
+def create_engine(backend, model_name, threads=0):
+    if backend not in ENGINES:
+        raise ValueError(
+            f"Unknown YOLO_BACKEND '{backend}', choose one of {sorted(ENGINES)}"
+        )
+    return ENGINES[backend](model_name, threads)
+
+
+def model_path(model_name, backend="ultralytics"):
+    """Lokasi file model per backend (mengikuti layout export ultralytics)."""
+    if backend in ("onnxruntime", "opencv"):
+        return os.path.join(MODELS_DIR, f"{model_name}.onnx")
+    if backend == "openvino":
+        return os.path.join(
+            MODELS_DIR, f"{model_name}_openvino_model", f"{model_name}.xml"
+        )
+    # ultralytics & ncnn: folder hasil export NCNN
+    return os.path.join(MODELS_DIR, f"{model_name}_ncnn_model")
+
+
+def available_models(backend="ultralytics"):
+    """Nama model di MODELS_DIR yang bisa dibuka oleh backend tersebut."""
+    if not os.path.isdir(MODELS_DIR):
+        return []
+
+    names = set()
+    for entry in os.listdir(MODELS_DIR):
+        for suffix in (".onnx", "_openvino_model", "_ncnn_model"):
+            if entry.endswith(suffix):
+                names.add(entry[: -len(suffix)])
+    return sorted(name for name in names if os.path.exists(model_path(name, backend)))
+
+
+def has_model(model_name):
+    """True jika file model ada untuk salah satu backend."""
+    return any(os.path.exists(model_path(model_name, backend)) for backend in ENGINES)
+
+
+def parse_names(text):
+    """Parse string "{0: 'tree', ...}" dari metadata model."""
+    if not text:
+        return {}
+    try:
+        names = ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return {}
+    if isinstance(names, (list, tuple)):
+        names = dict(enumerate(names))
+    return {int(k): str(v) for k, v in names.items()}
+
+
+def load_names(path):
+    """
+    Nama class dari metadata.yaml hasil export ultralytics (di folder model
+    atau di samping file model). Fallback: nama = index class.
+    """
+    folder = path if os.path.isdir(path) else os.path.dirname(path)
+    metadata = os.path.join(folder, "metadata.yaml")
+    if not os.path.exists(metadata):
+        return {}
+
+    names = {}
+    in_names = False
+    with open(metadata, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if line.startswith("names:"):
+                in_names = True
+                continue
+            if in_names:
+                if not line.startswith((" ", "\t")):
+                    break
+                key, _, value = line.strip().partition(":")
+                names[int(key)] = value.strip().strip("'\"")
+    return names
+
+
+def onnx_input_dims(path):
+    """
+    Dimensi input pertama model ONNX (None untuk dimensi dinamis), dibaca
+    dari protobuf tanpa package onnx:
+    ModelProto.graph(7) -> input(11) -> type(2) -> tensor_type(1) -> shape(2).
+    """
+    with open(path, "rb") as f:
+        message = memoryview(f.read())
+
+    for number in (7, 11, 2, 1, 2):
+        message = _protobuf_field(message, number)
+        if message is None:
+            return []
+
+    dims = []
+    for number, dim in _protobuf_fields(message):
+        if number == 1:
+            # Dimension: dim_value(1) int64, dim_param(2) nama dimensi dinamis
+            value = _protobuf_field(dim, 1)
+            dims.append(value if isinstance(value, int) else None)
+    return dims
+
+
+def _protobuf_field(message, number):
+    """Nilai pertama field `number` dalam message, None jika tidak ada."""
+    for field, value in _protobuf_fields(message):
+        if field == number:
+            return value
+    return None
+
+
+def _protobuf_fields(message):
+    """(nomor field, nilai) setiap field; varint -> int, lainnya -> bytes."""
+    position = 0
+    while position < len(message):
+        key, position = _varint(message, position)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, position = _varint(message, position)
+        elif wire_type == 2:
+            length, position = _varint(message, position)
+            value = message[position : position + length]
+            position += length
+        elif wire_type in (1, 5):
+            size = 8 if wire_type == 1 else 4
+            value = message[position : position + size]
+            position += size
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+        yield number, value
+
+
+def _varint(message, position):
+    result = shift = 0
+    while True:
+        byte = message[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+def _static_shape(dims):
+    """(h, w) jika kedua dimensi berupa angka, None jika dinamis."""
+    if len(dims) == 2 and all(isinstance(d, int) and d > 0 for d in dims):
+        return tuple(dims)
+    return None
+
+
+def _require(package, backend):
+    try:
+        return __import__(package)
+    except ImportError as e:
+        raise RuntimeError(
+            f"Backend '{backend}' requires the '{package}' package"
+        ) from e
@@ -3,6 +3,7 @@ from PyQt5.QtCore import QThread, pyqtSignal
 import time
 
 from enums.log import LogLevel, LogSource
+from utils.affinity import pin_current_thread
 from utils.logger import add_log
 
 
@@ -10,16 +11,18 @@ class LidarController(QThread):
     data_received = pyqtSignal(dict)
     connection_lost = pyqtSignal()
 
-    def __init__(self, port: str = None, baudrate: int = 115200):
+    def __init__(self, port: str = None, baudrate: int = 115200, cpus=None):
         """
         :param port: Serial port (e.g., '/dev/ttyUSB0'). Auto-detect if None.
         :param baudrate: Baudrate for Lidar, default 115200
+        :param cpus: CPU cores to pin the reading thread to (None = no pinning)
         """
         super().__init__()
         self.port = port
         # if self.port is None:
         #     raise RuntimeError("Lidar not found on any serial port")
         self.baudrate = baudrate
+        self.cpus = cpus
         self.ser: serial.Serial = None
         self._running = False
 
@@ -59,6 +62,7 @@ class LidarController(QThread):
 
     def run(self):
         """Start the Lidar reading thread"""
+        pin_current_thread(self.cpus)
         try:
             self._open_serial()
             self._running = True
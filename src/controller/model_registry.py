@@ -0,0 +1,137 @@
+import threading
+import time
+
+from configs.config_manager import ConfigManager
+from controller.engine import create_engine
+from enums.log import LogLevel, LogSource
+from utils.affinity import pinned, plan_affinity
+from utils.letterbox import inference_shape
+from utils.logger import add_log
+
+
+class ModelRegistry:
+    """
+    Cache inference engine per (backend, nama model, threads) untuk seluruh proses.
+    Engine di-load dan di-warm-up sekali (bisa di background saat app start),
+    lalu diberikan langsung ke YOLOThreadController setiap kali Start ditekan.
+    """
+
+    def __init__(self, warmup_runs=3):
+        self.warmup_runs = warmup_runs
+        self._lock = threading.Lock()
+        self._models = {}
+        self._loading = {}  # (backend, name, threads) -> threading.Event
+        self._errors = {}
+
+    def preload(
+        self, name, imgsz=(480, 640), backend="ultralytics", threads=0, cpus=None
+    ):
+        """Load + warm-up model di background thread. Tidak blocking."""
+        key = (backend, name, threads)
+        with self._lock:
+            if key in self._models or key in self._loading:
+                return
+
+        threading.Thread(
+            target=self._get_silently,
+            args=(name, imgsz, backend, threads, cpus),
+            name=f"preload-{name}",
+            daemon=True,
+        ).start()
+
+    def get(self, name, imgsz=(480, 640), backend="ultralytics", threads=0, cpus=None):
+        """
+        Ambil engine dari cache, tunggu / load jika belum tersedia.
+        cpus: load & warm-up dijalankan ter-pin ke core ini, sehingga thread
+        pool runtime yang dibuat saat itu ikut berjalan di core inference.
+        """
+        key = (backend, name, threads)
+        with self._lock:
+            if key in self._models:
+                return self._models[key]
+
+            event = self._loading.get(key)
+            owner = event is None
+            if owner:
+                event = threading.Event()
+                self._loading[key] = event
+                self._errors.pop(key, None)
+
+        if owner:
+            self._load(key, imgsz, cpus, event)
+        else:
+            event.wait()
+
+        with self._lock:
+            if key in self._models:
+                return self._models[key]
+            raise RuntimeError(
+                f"Failed to load model '{name}' ({backend}): {self._errors[key]}"
+            )
+
+    def is_ready(self, name, backend="ultralytics", threads=0):
+        return (backend, name, threads) in self._models
+
+    def _get_silently(self, name, imgsz, backend, threads, cpus):
+        try:
+            self.get(name, imgsz, backend, threads, cpus)
+        except RuntimeError as e:
+            print(f"[ModelRegistry] {e}")
+
+    def _load(self, key, imgsz, cpus, event):
+        backend, name, threads = key
+        try:
+            with pinned(cpus):
+                started = time.monotonic()
+                engine = create_engine(backend, name, threads)
+                loaded = time.monotonic()
+                engine.warmup(imgsz, self.warmup_runs)
+                warmed = time.monotonic()
+
+            with self._lock:
+                self._models[key] = engine
+
+            add_log(
+                LogLevel.INFO.value,
+                LogSource.CORE_INFERENCE.value,
+                f"Model {name} ({backend}) loaded in {loaded - started:.2f}s, "
+                f"warm-up {warmed - loaded:.2f}s, threads {engine.threads}",
+            )
+        except Exception as e:
+            with self._lock:
+                self._errors[key] = str(e)
+            add_log(
+                LogLevel.ERROR.value,
+                LogSource.CORE_INFERENCE.value,
+                f"Failed to load model {name} ({backend}): {e}",
+            )
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            event.set()
+
+
+model_registry = ModelRegistry()
+
+
+def preload_configured_model():
+    """Preload model sesuai config (YOLO_*, IMG_SIZE, CAPTURE_*, INFERENCE_*)."""
+    configs = ConfigManager().get_all()
+    threads, cpus, _ = plan_affinity(
+        configs.get("INFERENCE_CPUS"),
+        configs.get("IO_CPUS"),
+        configs.get("INFERENCE_THREADS", 0),
+    )
+    width, height = inference_shape(
+        configs.get("CAPTURE_WIDTH", 640),
+        configs.get("CAPTURE_HEIGHT", 480),
+        configs.get("IMG_SIZE", 640),
+        configs.get("RECT_INFERENCE", True),
+    )
+    model_registry.preload(
+        configs.get("YOLO_MODEL", "medium_tree"),
+        imgsz=(height, width),
+        backend=configs.get("YOLO_BACKEND", "ultralytics"),
+        threads=threads,
+        cpus=cpus,
+    )
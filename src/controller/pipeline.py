@@ -0,0 +1,64 @@
+import threading
+import time
+
+from utils.affinity import pin_current_thread
+
+
+class PipelineStage(threading.Thread):
+    """
+    Satu stage pipeline: ambil item dari input queue, proses dengan handler,
+    lalu teruskan hasilnya ke semua output queue.
+    Handler yang return None berarti item tidak diteruskan.
+    cpus: pin thread stage ke core tertentu (None = tidak di-pin).
+    """
+
+    def __init__(self, name, handler, input_queue, outputs=None, cpus=None):
+        super().__init__(name=name, daemon=True)
+        self.handler = handler
+        self.input_queue = input_queue
+        self.outputs = outputs or []
+        self.cpus = cpus
+        self.processed = 0
+        self.busy_time = 0.0
+        self._running = False
+
+    def run(self):
+        self._running = True
+        pin_current_thread(self.cpus)
+
+        while self._running:
+            item = self.input_queue.get(timeout=0.1)
+            if item is None:
+                continue
+
+            started = time.monotonic()
+            try:
+                result = self.handler(item)
+            except Exception as e:
+                print(f"[Pipeline] Stage '{self.name}' failed: {e}")
+                continue
+            finally:
+                self.busy_time += time.monotonic() - started
+
+            self.processed += 1
+
+            if result is None:
+                continue
+
+            for queue in self.outputs:
+                queue.put(result)
+
+    def stats(self):
+        """Queue depth, drop count dan waktu proses stage ini."""
+        return {
+            "depth": self.input_queue.depth,
+            "dropped": self.input_queue.dropped,
+            "processed": self.processed,
+            "busy_s": round(self.busy_time, 3),
+        }
+
+    def stop(self):
+        """Stop stage thread."""
+        self._running = False
+        if self.is_alive():
+            self.join(timeout=1.0)
@@ -1,23 +1,48 @@
 import serial
 from PyQt5.QtCore import QThread, pyqtSignal
+from collections import deque
 import time
 
+from utils.affinity import pin_current_thread
+
+
+# Perintah tanpa BUSY/READY dalam waktu ini dianggap tidak di-ack MCU
+ACK_TIMEOUT_S = 2.0
+
 
 class SerialController(QThread):
+    """
+    Kirim perintah nozzle ke Arduino dan baca status BUSY/READY.
+
+    Jika `latency` (LatencyRecorder) diberikan, setiap perintah dicatat
+    bersama timestamp frame asalnya lalu dipasangkan dengan respon MCU:
+    capture_to_send (frame dibaca -> perintah ditulis), send_to_ack
+    (perintah ditulis -> BUSY/READY pertama), capture_to_ack dan mcu_busy
+    (BUSY -> READY).
+    """
+
     data_received = pyqtSignal(str)
     connection_lost = pyqtSignal()
 
-    def __init__(self, port, baudrate=9600):
+    def __init__(self, port, baudrate=9600, cpus=None, latency=None):
         super().__init__()
         self.port = port
         self.baudrate = baudrate
+        self.cpus = cpus
+        self.latency = latency
         self.ser = None
         self.is_busy = False
+        self.unacked = 0
+
+        # (data, frame timestamp, waktu kirim), dibatasi jika MCU tidak merespon
+        self._pending = deque(maxlen=32)
+        self._busy_since = None
 
         self._running = False
 
     def run(self):
         """Start serial communication thread"""
+        pin_current_thread(self.cpus)
         try:
             self._open_serial()
             self._running = True
@@ -36,36 +61,71 @@ class SerialController(QThread):
         """Listen for incoming data and emit signals"""
         while self._running:
             self._read_serial()
-            time.sleep(0.05)
+            # Interval poll menentukan resolusi latency send -> ack
+            time.sleep(0.01)
 
     def _read_serial(self):
         """Read a single line from serial if available"""
         if self.ser and self.ser.in_waiting > 0:
             try:
                 line = self.ser.readline().decode(errors="ignore").strip()
+                received = time.monotonic()
                 if line:
                     self.data_received.emit(line)
                     print(f"[Serial] - {line}")
 
                 if "BUSY" in line.upper():
                     self.is_busy = True
+                    self._busy_since = received
+                    self._acknowledge(received)
                     print("[Serial] Arduino BUSY → Stop sending commands")
 
                 elif "READY" in line.upper():
                     self.is_busy = False
+                    if self._busy_since is None:
+                        # READY tanpa BUSY: MCU selesai sebelum sempat lapor BUSY
+                        self._acknowledge(received)
+                    elif self.latency:
+                        self.latency.record("mcu_busy", received - self._busy_since)
+                    self._busy_since = None
                     print("[Serial] Arduino READY → Send enabled")
 
             except Exception as e:
                 print(f"[Serial] Failed to read data: {e}")
 
-    def send(self, data):
-        """Send data to serial"""
+    def send(self, data, timestamp=None):
+        """
+        Send data to serial.
+        timestamp: time.monotonic() saat frame asal perintah di-capture
+        """
         if self.ser and self.ser.is_open:
             try:
                 self.ser.write((data + "\n").encode())
+                sent = time.monotonic()
                 print(f"[Serial] Sent: {data}")
             except Exception as e:
                 print(f"[Serial] Failed to send: {e}")
+                return
+
+            if self.latency:
+                if timestamp is not None:
+                    self.latency.record("capture_to_send", sent - timestamp)
+                self._pending.append((data, timestamp, sent))
+
+    def _acknowledge(self, received):
+        """Pasangkan respon MCU dengan perintah tertua yang belum di-ack."""
+        while self._pending:
+            data, timestamp, sent = self._pending.popleft()
+            if received - sent > ACK_TIMEOUT_S:
+                self.unacked += 1
+                print(f"[Serial] No ack for: {data}")
+                continue
+
+            if self.latency:
+                self.latency.record("send_to_ack", received - sent)
+                if timestamp is not None:
+                    self.latency.record("capture_to_ack", received - timestamp)
+            return
 
     def _handle_serial_error(self, error):
         """Handle serial errors and emit connection_lost"""
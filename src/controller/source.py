@@ -0,0 +1,309 @@
+import os
+import time
+
+import cv2
+
+from enums.log import LogLevel, LogSource
+from utils.logger import add_log
+
+CAPTURE_BACKENDS = {
+    "auto": cv2.CAP_ANY,
+    "v4l2": cv2.CAP_V4L2,
+    "gstreamer": cv2.CAP_GSTREAMER,
+    "ffmpeg": cv2.CAP_FFMPEG,
+}
+
+# {device}, {width}, {height}, {fps} diisi dari config. Di Raspberry Pi,
+# "jpegdec" bisa diganti "v4l2jpegdec" untuk decode MJPEG di hardware.
+DEFAULT_GSTREAMER_PIPELINE = (
+    "v4l2src device={device} ! "
+    "image/jpeg,width={width},height={height},framerate={fps}/1 ! "
+    "jpegdec ! videoconvert ! video/x-raw,format=BGR ! "
+    "appsink drop=true max-buffers=1 sync=false"
+)
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+def open_capture(
+    source,
+    backend="auto",
+    width=640,
+    height=480,
+    fps=30,
+    pipeline=None,
+    jpeg_decoder="opencv",
+    replay=None,
+    source_type="camera",
+):
+    """
+    Buka sumber video dengan backend capture tertentu.
+
+    source       : index kamera, path device (/dev/video2, /dev/v4l/by-id/...),
+                   URL stream, path file video, atau folder gambar
+    backend      : auto | v4l2 | gstreamer | ffmpeg
+    pipeline     : pipeline GStreamer custom (backend gstreamer)
+    jpeg_decoder : opencv | turbojpeg (MJPEG kamera USB di-decode dengan
+                   libjpeg-turbo + downscale saat decode, lihat TurboJpegCapture)
+    replay       : opsi ReplayCapture untuk file / folder gambar
+    source_type  : camera | file | images; file & images dibuka ReplayCapture
+    """
+    if backend not in CAPTURE_BACKENDS:
+        raise ValueError(
+            f"Unknown CAPTURE_BACKEND '{backend}', choose one of "
+            f"{sorted(CAPTURE_BACKENDS)}"
+        )
+
+    if source_type in ("file", "images"):
+        api = cv2.CAP_ANY if backend == "gstreamer" else CAPTURE_BACKENDS[backend]
+        return ReplayCapture(source, api, **(replay or {}))
+
+    if backend == "gstreamer":
+        device = f"/dev/video{source}" if isinstance(source, int) else source
+        pipeline = (pipeline or DEFAULT_GSTREAMER_PIPELINE).format(
+            device=device, width=width, height=height, fps=fps
+        )
+        return cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+
+    cap = cv2.VideoCapture(source, CAPTURE_BACKENDS[backend])
+    if isinstance(source, str) and "://" in source:
+        return cap  # URL stream: resolusi & codec mengikuti sumber
+
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    cap.set(cv2.CAP_PROP_FPS, fps)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    if jpeg_decoder == "turbojpeg":
+        return TurboJpegCapture.wrap(cap)
+    return cap
+
+
+def guess_source_type(source):
+    """
+    Type source tanpa "type" eksplisit: file video reguler -> file, folder
+    -> images, selain itu (index, /dev/video*, /dev/v4l/by-id/..., URL) -> camera.
+    """
+    if not isinstance(source, str) or os.path.realpath(source).startswith("/dev/"):
+        return "camera"
+    if os.path.isdir(source):
+        return "images"
+    if os.path.isfile(source):
+        return "file"
+    return "camera"
+
+
+class TurboJpegCapture:
+    """
+    Ambil frame MJPEG mentah dari driver (CAP_PROP_CONVERT_RGB=0) lalu
+    decode dengan libjpeg-turbo. Decode langsung di skala 1/2, 1/4 atau 1/8
+    jika frame yang dibutuhkan pipeline lebih kecil dari resolusi kamera,
+    sehingga decode tidak lagi memakan satu core penuh.
+    """
+
+    def __init__(self, cap, jpeg, flags=0):
+        self.cap = cap
+        self.jpeg = jpeg
+        self.flags = flags
+        self.scaling_factor = None
+
+    @classmethod
+    def wrap(cls, cap):
+        """Return TurboJpegCapture, atau cap apa adanya jika tidak didukung."""
+        try:
+            import turbojpeg
+            jpeg = turbojpeg.TurboJPEG()
+        except (ImportError, RuntimeError, OSError) as e:
+            add_log(
+                LogLevel.WARNING.value,
+                LogSource.CORE_CAMERA.value,
+                f"turbojpeg unavailable, falling back to OpenCV decode: {e}",
+            )
+            return cap
+
+        if not cap.set(cv2.CAP_PROP_CONVERT_RGB, 0):
+            return cap  # backend tidak bisa memberikan JPEG mentah
+
+        flags = turbojpeg.TJFLAG_FASTDCT | turbojpeg.TJFLAG_FASTUPSAMPLE
+        return cls(cap, jpeg, flags)
+
+    def set_target_size(self, width, height):
+        """Pilih skala decode terkecil yang masih >= ukuran frame pipeline."""
+        source_width = self.get(cv2.CAP_PROP_FRAME_WIDTH)
+        source_height = self.get(cv2.CAP_PROP_FRAME_HEIGHT)
+        if not source_width or not source_height:
+            return
+
+        best = None
+        for num, denom in self.jpeg.scaling_factors:
+            if num > denom:
+                continue
+            if source_width * num / denom < width:
+                continue
+            if source_height * num / denom < height:
+                continue
+            if best is None or num / denom < best[0] / best[1]:
+                best = (num, denom)
+
+        self.scaling_factor = None if best in (None, (1, 1)) else best
+
+    def read(self):
+        ret, buffer = self.cap.read()
+        if not ret:
+            return False, None
+        if buffer.ndim == 3:
+            return True, buffer  # driver sudah memberikan frame BGR
+
+        try:
+            image = self.jpeg.decode(
+                buffer.reshape(-1),
+                scaling_factor=self.scaling_factor,
+                flags=self.flags,
+            )
+        except OSError:
+            return False, None  # frame JPEG korup dari kamera
+        return True, image
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def set(self, prop, value):
+        return self.cap.set(prop, value)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+
+class ReplayCapture:
+    """
+    Putar ulang file video atau folder gambar seolah-olah kamera.
+
+    realtime=True  : frame dikeluarkan sesuai FPS asli sumber. Jika pembaca
+                     tertinggal, frame dilewati (grab tanpa decode) seperti
+                     kamera asli yang men-drop frame.
+    realtime=False : secepat mungkin, untuk mengukur throughput pipeline.
+    loop           : kembali ke start setelah end / akhir sumber.
+    start, end     : offset dalam detik (end None = sampai akhir).
+    fps            : FPS folder gambar (atau file tanpa info FPS).
+    """
+
+    def __init__(
+        self,
+        path,
+        api=cv2.CAP_ANY,
+        realtime=True,
+        loop=False,
+        start=0.0,
+        end=None,
+        fps=30.0,
+    ):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.finished = False
+
+        if os.path.isdir(path):
+            self.cap = None
+            self.images = sorted(
+                os.path.join(path, file)
+                for file in os.listdir(path)
+                if file.lower().endswith(IMAGE_EXTENSIONS)
+            )
+            self.fps = fps
+            self.frame_count = len(self.images)
+            first = cv2.imread(self.images[0]) if self.images else None
+            self.height, self.width = first.shape[:2] if first is not None else (0, 0)
+        else:
+            self.images = None
+            self.cap = cv2.VideoCapture(path, api)
+            self.fps = self.cap.get(cv2.CAP_PROP_FPS) or fps
+            # Sebagian container tidak menyimpan jumlah frame (0 / -1)
+            frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            self.frame_count = frame_count if frame_count > 0 else None
+            self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+        self.start_frame = int(start * self.fps)
+        self.end_frame = int(end * self.fps) if end else self.frame_count
+        if self.frame_count is not None and self.end_frame is not None:
+            self.end_frame = min(self.end_frame, self.frame_count)
+        self._seek(self.start_frame)
+
+    def _seek(self, position):
+        self.position = position
+        if self.cap is not None:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, position)
+        self._clock_start = time.monotonic()
+        self._clock_position = position
+
+    def _next(self, decode=True):
+        """Frame berikutnya (None di akhir sumber / end offset)."""
+        while self.end_frame is None or self.position < self.end_frame:
+            self.position += 1
+
+            if self.images is not None:
+                if not decode:
+                    return True
+                image = cv2.imread(self.images[self.position - 1])
+                if image is not None:
+                    return image
+                continue  # file gambar rusak, lewati
+
+            if not decode:
+                return self.cap.grab() or None
+            ret, image = self.cap.read()
+            return image if ret else None
+        return None
+
+    def _pace(self):
+        due = self._clock_start + (self.position - self._clock_position) / self.fps
+        delay = due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+            return
+
+        # Tertinggal lebih dari satu frame: lewati seperti kamera asli
+        for _ in range(int(-delay * self.fps)):
+            if self._next(decode=False) is None:
+                break
+
+    def read(self):
+        if self.finished:
+            return False, None
+        if self.realtime:
+            self._pace()
+
+        image = self._next()
+        if image is None and self.loop:
+            self._seek(self.start_frame)
+            image = self._next()
+
+        if image is None:
+            self.finished = True
+            return False, None
+        return True, image
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.width
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.height
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        return self.cap.get(prop) if self.cap is not None else 0
+
+    def set(self, prop, value):
+        return False  # resolusi / FPS mengikuti sumber
+
+    def isOpened(self):
+        if self.cap is not None:
+            return self.cap.isOpened()
+        return bool(self.images)
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
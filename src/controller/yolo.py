@@ -1,51 +1,223 @@
 from PyQt5.QtCore import QThread, pyqtSignal
-from PyQt5.QtGui import QImage
 import cv2
-from ultralytics import YOLO
+import numpy as np
+import time
 
 from configs.config_manager import ConfigManager
+from controller.camera import CameraContext
+from controller.model_registry import model_registry
+from controller.pipeline import PipelineStage
 from controller.serial import SerialController
+from controller.source import guess_source_type
 from controller.lidar import LidarController
+from enums.log import LogLevel, LogSource
+from utils.affinity import plan_affinity
+from utils.frame_buffer import BoundedQueue, FrameBatcher
+from utils.frame_pool import FramePool
+from utils.latency import LatencyRecorder, format_latency
+from utils.logger import add_log
+from utils.metrics import RateCounter, performance_metrics
+from utils.opencv import draw_boxes_on_frame
+from utils.scheduler import FrameSkipScheduler
+from utils.spray_registry import SprayRegistry
+from utils.target import TargetSelector
+from utils.tracker import ObjectTracker
+from utils.zone import ZoneMapper
 
 
 class YOLOThreadController(QThread):
-    frame_ready = pyqtSignal(QImage)
+    frame_ready = pyqtSignal(object)  # DisplayFrame, wajib di-release() oleh GUI
     detection_ready = pyqtSignal(str)
-
-    def __init__(self):
+    stats_ready = pyqtSignal(dict)
+    latency_ready = pyqtSignal(dict)  # {stage: {p50, p95, p99 (ms), count}}
+
+    def __init__(self, headless=False, overrides=None):
+        """
+        headless  : tanpa render stage / QImage (service tanpa layar).
+        overrides : dict config yang menimpa config.json tanpa menyimpannya
+                    (dipakai script/benchmark.py).
+        """
         super().__init__()
+        self.headless = headless
         self.running = False
-        self.cap = None
+        self.engine = None
+        self.stages = []
+
+        # Frame terbaru per kamera -> satu batch -> satu forward pass.
+        # Stage inference mengambil langsung dari batcher saat siap, sehingga
+        # batch berisi frame semua kamera yang masuk selama forward pass lalu.
+        self.detect_batcher = None
+        self.postprocess_queue = BoundedQueue(maxsize=2)
+        self.frame_pool = FramePool(size=3)
+        self.display_size = None  # (width, height) area tampilan GUI
+
         self.left_distance = None
         self.right_distance = None
 
-        self._init_configs()
+        # Counter kumulatif untuk panel performa dashboard
+        self.inferred_frames = 0
+        self.lidar_samples = {"LEFT": 0, "RIGHT": 0}
+        self.serial_sent = 0
+        self.serial_skipped_busy = 0
+        self._busy_reported = False
+        self.rates = RateCounter()
+
+        self._init_configs(overrides)
         self._init_serial_controller()
         self._init_lidar_controller()
 
-    def _init_configs(self):
+    def _init_configs(self, overrides=None):
         self.config_manager = ConfigManager()
-        self.configs = self.config_manager.get_all()
+        self.configs = {**self.config_manager.get_all(), **(overrides or {})}
         self.camera_index = self.configs.get("CAMERA_INDEX", 0)
         self.model_name = self.configs.get("YOLO_MODEL", "medium_tree")
+        self.backend = self.configs.get("YOLO_BACKEND", "ultralytics")
+        self.iou_threshold = self.configs.get("IOU_THRESHOLD", 0.45)
+        self.inference_threads, self.inference_cpus, self.io_cpus = plan_affinity(
+            self.configs.get("INFERENCE_CPUS"),
+            self.configs.get("IO_CPUS"),
+            self.configs.get("INFERENCE_THREADS", 0),
+        )
+        self.imgsz = self.configs.get("IMG_SIZE", 640)
+        self.rect_inference = self.configs.get("RECT_INFERENCE", True)
+        self.capture_width = self.configs.get("CAPTURE_WIDTH", 640)
+        self.capture_height = self.configs.get("CAPTURE_HEIGHT", 480)
+        self.capture_backend = self.configs.get("CAPTURE_BACKEND", "auto")
+        self.jpeg_decoder = self.configs.get("JPEG_DECODER", "opencv")
+        self.replay = {
+            "realtime": self.configs.get("REPLAY_MODE", "realtime") == "realtime",
+            "loop": self.configs.get("REPLAY_LOOP", False),
+            "start": self.configs.get("REPLAY_START_S", 0.0),
+            "end": self.configs.get("REPLAY_END_S") or None,
+            "fps": self.configs.get("REPLAY_FPS", 30.0),
+        }
         self.conf_threshold = self.configs.get("CONFIDENCE", 0.6)
         self.serial_port = self.configs.get("SERIAL_PORT", "")
         self.baudrate = self.configs.get("BAUDRATE", 9600)
-        self.frame_skip = self.configs.get("FPS", 5)
         self.lidar_left_port = self.configs.get("LIDAR_LEFT_PORT", "")
         self.lidar_right_port = self.configs.get("LIDAR_RIGHT_PORT", "")
         self.lidar_threshold = self.configs.get("LIDAR_THRESHOLD", 200)
+        self.detection_hold = self.configs.get("DETECTION_HOLD_MS", 500) / 1000.0
+        self.display_interpolation = self.configs.get("DISPLAY_INTERPOLATION", "fast")
+        self.latency = LatencyRecorder(window=self.configs.get("LATENCY_WINDOW", 512))
+        self.latency_log_interval = self.configs.get("LATENCY_LOG_INTERVAL_S", 60)
+        # Dengan tracking, deteksi low-conf tetap diminta dari model untuk
+        # tahap asosiasi kedua ByteTrack; tanpa tracking cukup CONFIDENCE.
+        self.inference_conf = (
+            min(self.conf_threshold, self.configs.get("TRACK_LOW_CONF", 0.1))
+            if self.configs.get("TRACKING_ENABLED", True)
+            else self.conf_threshold
+        )
+        self.cameras = self._init_cameras()
+        self.display_camera = min(
+            self.configs.get("DISPLAY_CAMERA", 0), len(self.cameras) - 1
+        )
+        self.target_selector = TargetSelector(
+            weights=self.configs.get("TARGET_WEIGHTS"),
+            zone_weights=self.configs.get("TARGET_ZONE_WEIGHTS"),
+        )
+        self.spray_overlay = self.configs.get(
+            "SPRAY_REGISTRY_ENABLED", True
+        ) and self.configs.get("SPRAY_OVERLAY", True)
+
+    def _init_cameras(self):
+        """
+        CAMERAS: satu entry per kamera, mis.
+            [{"source": 0, "zones": ["LEFT"]}, {"source": 2, "zones": ["RIGHT"]}]
+        Nama zone menentukan lidar & pesan nozzle yang dipakai deteksi kamera itu.
+        "backend" / "pipeline" per kamera menimpa CAPTURE_BACKEND / CAPTURE_PIPELINE.
+        Tanpa CAMERAS: satu kamera yang dibagi menjadi ZONES.
+        """
+        cameras = self.configs.get("CAMERAS") or [
+            {"zones": self.configs.get("ZONES", ["LEFT", "RIGHT"])}
+        ]
+        contexts = []
+        for index, camera in enumerate(cameras):
+            source, source_type = self._camera_source(camera)
+            contexts.append(
+                CameraContext(
+                    index,
+                    source,
+                    zone_mapper=ZoneMapper(
+                        names=camera.get("zones", ["LEFT", "RIGHT"]),
+                        dead_zone=self.configs.get("ZONE_DEAD_BAND", 0.0),
+                        margin=self.configs.get("ZONE_MARGIN", 0.0),
+                    ),
+                    scheduler=self._init_scheduler(),
+                    tracker=self._init_tracker(),
+                    spray_registry=self._init_spray_registry(),
+                    backend=camera.get("backend", self.capture_backend),
+                    pipeline=camera.get(
+                        "pipeline", self.configs.get("CAPTURE_PIPELINE") or None
+                    ),
+                    source_type=source_type,
+                )
+            )
+        return contexts
+
+    def _camera_source(self, camera):
+        """
+        (source, type) satu entry CAMERAS. "type" per kamera (camera, file
+        atau images) menentukan apakah source dibuka sebagai kamera atau
+        replay. Tanpa "type": "source" ditebak dari path (guess_source_type),
+        entry tanpa "source" mengikuti SOURCE_TYPE: camera (CAMERA_INDEX),
+        file (video) atau images (folder), path diambil dari SOURCE_PATH.
+        """
+        if "source" in camera:
+            source_type = guess_source_type(camera["source"])
+        else:
+            source_type = self.configs.get("SOURCE_TYPE", "camera")
+        source_type = camera.get("type", source_type)
 
-        self.counter = 0
-        self.model = YOLO(self._get_model_path(self.model_name))
+        if source_type not in ("camera", "file", "images"):
+            raise ValueError(
+                f"Unknown SOURCE_TYPE '{source_type}', choose camera, file or images"
+            )
+
+        if "source" in camera:
+            return camera["source"], source_type
+        if source_type == "camera":
+            return self.camera_index, source_type
+        return self.configs.get("SOURCE_PATH", ""), source_type
+
+    def _init_scheduler(self):
+        return FrameSkipScheduler(
+            target_fps=self.configs.get("FPS", 10),
+            mode=self.configs.get("SCHEDULER_MODE", "fps"),
+            latency_budget_ms=self.configs.get("LATENCY_BUDGET_MS", 150),
+            fixed_skip=self.configs.get("FRAME_SKIP", 0),
+        )
 
-    def _get_model_path(self, model_name):
-        return f"models/{model_name}_ncnn_model"
+    def _init_tracker(self):
+        if not self.configs.get("TRACKING_ENABLED", True):
+            return None
+
+        return ObjectTracker(
+            high_conf=self.conf_threshold,
+            low_conf=self.configs.get("TRACK_LOW_CONF", 0.1),
+            match_iou=self.configs.get("TRACK_MATCH_IOU", 0.3),
+            max_age=self.configs.get("TRACK_MAX_AGE_MS", 1000) / 1000.0,
+            min_hits=self.configs.get("TRACK_MIN_HITS", 1),
+        )
+
+    def _init_spray_registry(self):
+        if not self.configs.get("SPRAY_REGISTRY_ENABLED", True):
+            return None
+
+        return SprayRegistry(
+            ttl=self.configs.get("SPRAY_TTL_S", 10),
+            max_entries=self.configs.get("SPRAY_MAX_ENTRIES", 256),
+            cell_size=self.configs.get("SPRAY_CELL_PX", 64),
+            match_iou=self.configs.get("SPRAY_MATCH_IOU", 0.3),
+        )
 
     def _init_serial_controller(self):
         if self.serial_port:
             self.serial_controller = SerialController(
-                port=self.serial_port, baudrate=self.baudrate
+                port=self.serial_port,
+                baudrate=self.baudrate,
+                cpus=self.io_cpus,
+                latency=self.latency,
             )
             self.serial_controller.start()
         else:
@@ -53,8 +225,10 @@ class YOLOThreadController(QThread):
 
     def _init_lidar_controller(self):
 
-        self.lidar_left = LidarController(port=self.lidar_left_port)
-        self.lidar_right = LidarController(port=self.lidar_right_port)
+        self.lidar_left = LidarController(port=self.lidar_left_port, cpus=self.io_cpus)
+        self.lidar_right = LidarController(
+            port=self.lidar_right_port, cpus=self.io_cpus
+        )
 
         self.lidar_left.data_received.connect(self.update_left_distance)
         self.lidar_right.data_received.connect(self.update_right_distance)
@@ -64,21 +238,21 @@ class YOLOThreadController(QThread):
 
     def update_left_distance(self, data):
         self.left_distance = data["distance_cm"]
+        self.lidar_samples["LEFT"] += 1
 
     def update_right_distance(self, data):
         self.right_distance = data["distance_cm"]
+        self.lidar_samples["RIGHT"] += 1
 
     def _is_distance_valid(self, position):
-
+        # Dipanggil per target per frame: jangan print di sini (masuk log service)
         if position == "LEFT":
-            print(f"======LEFT: {self.left_distance}cm")
             return (
                 self.left_distance is not None
                 and self.left_distance < self.lidar_threshold
             )
 
         elif position == "RIGHT":
-            print(f"======RIGHT: {self.right_distance}cm")
             return (
                 self.right_distance is not None
                 and self.right_distance < self.lidar_threshold
@@ -86,84 +260,431 @@ class YOLOThreadController(QThread):
 
         return False
 
-    def get_object_position(self, frame_width, box):
-        x1, y1, x2, y2 = box.xyxy[0]
-        x_center = (x1 + x2) / 2
-        half_width = frame_width / 2
-
-        return "LEFT" if x_center < half_width else "RIGHT"
-
-    def _send_serial_message(self, message):
+    def _send_serial_message(self, message, timestamp=None):
+        """timestamp: waktu capture frame asal, untuk latency capture -> ack."""
         if (
             self.serial_controller
             and self.serial_controller.ser
             and self.serial_controller.ser.is_open
         ):
             if self.serial_controller.is_busy:
-                print("[YOLOThread] Arduino is BUSY → Skip sending")
-                self.detection_ready.emit("[YOLOThread] Arduino is BUSY → Skip sending")
-                return
+                self.serial_skipped_busy += 1
+                # Hanya saat status berubah, bukan setiap frame selama BUSY
+                if not self._busy_reported:
+                    self._busy_reported = True
+                    print("[YOLOThread] Arduino is BUSY → Skip sending")
+                    self.detection_ready.emit(
+                        "[YOLOThread] Arduino is BUSY → Skip sending"
+                    )
+                return False
+
+            self._busy_reported = False
+
+            started = time.monotonic()
+            self.serial_controller.send(message, timestamp)
+            self.latency.record("serial_write", time.monotonic() - started)
+            self.serial_sent += 1
+            return True
 
-            self.serial_controller.send(message)
+        return False
 
     def setup(self):
-        inferance_type = "videos"
-        source = (
-            self.camera_index
-            if inferance_type == "webcam"
-            else "videos/sample-large-1.MOV"
+        self.detect_batcher = FrameBatcher(len(self.cameras))
+
+        for camera in self.cameras:
+            camera.open(
+                self.capture_width,
+                self.capture_height,
+                self.imgsz,
+                self.rect_inference,
+                jpeg_decoder=self.jpeg_decoder,
+                replay=self.replay,
+            )
+            camera.create_capture(
+                self.detect_batcher,
+                display=not self.headless and camera.index == self.display_camera,
+                cpus=self.io_cpus,
+                latency=self.latency,
+            )
+
+        # Ukuran warm-up model; kamera lain dengan ukuran berbeda tetap jalan
+        self.model_imgsz = self.cameras[0].model_imgsz
+
+        self.stages = [
+            PipelineStage(
+                "inference",
+                self._inference,
+                self.detect_batcher,
+                outputs=[self.postprocess_queue],
+                cpus=self.inference_cpus,
+            ),
+            PipelineStage(
+                "postprocess",
+                self._postprocess,
+                self.postprocess_queue,
+                cpus=self.io_cpus,
+            ),
+        ]
+        if not self.headless:
+            self.stages.append(
+                PipelineStage(
+                    "render",
+                    self._render,
+                    self.cameras[self.display_camera].render_queue,
+                    cpus=self.io_cpus,
+                )
+            )
+
+    # ------------------------------------------------------------------
+    # PIPELINE STAGES
+    # capture (per kamera) -> inference (batch + scheduler) ->
+    # postprocess/actuation -> render
+    # Render menerima setiap frame kamera yang ditampilkan dan menggambar
+    # deteksi terakhir, sehingga display berjalan di rate kamera, terlepas
+    # dari kecepatan model.
+    # ------------------------------------------------------------------
+    def _schedule(self, batch):
+        """Pisahkan frame yang dikirim ke model dan frame untuk prediksi tracker."""
+        started = time.monotonic()
+        detect, predict = [], []
+        for frame in batch:
+            camera = self.cameras[frame.camera]
+            if camera.scheduler.should_detect(frame):
+                detect.append(frame)
+            elif camera.tracker:
+                predict.append((frame, None))
+
+        # Frame tanpa inference: posisi diprediksi tracker. Jangan sampai
+        # prediksi mendorong keluar hasil inference yang masih antri.
+        if predict and self.postprocess_queue.depth == 0:
+            self.postprocess_queue.put(predict)
+
+        self.latency.record("preprocess", time.monotonic() - started)
+        return detect
+
+    def _inference(self, batch):
+        """Satu forward pass untuk frame terbaru semua kamera (per ukuran input)."""
+        batch = self._schedule(batch)
+        if not batch:
+            return None
+
+        started = time.monotonic()
+
+        groups = {}
+        for frame in batch:
+            groups.setdefault(self.cameras[frame.camera].model_imgsz, []).append(frame)
+
+        results = []
+        for imgsz, frames in groups.items():
+            predict_started = time.monotonic()
+            detections = self.engine.infer_batch(
+                [frame.image for frame in frames],
+                imgsz,
+                conf=self.inference_conf,
+                iou=self.iou_threshold,
+                timestamps=[frame.timestamp for frame in frames],
+            )
+            self.latency.record("predict", time.monotonic() - predict_started)
+            if len(detections) != len(frames):
+                raise RuntimeError(
+                    f"{self.engine.backend} returned {len(detections)} results "
+                    f"for {len(frames)} frames"
+                )
+            results.extend(zip(frames, detections))
+
+        finished = time.monotonic()
+        self.inferred_frames += len(batch)
+        for frame in batch:
+            self.cameras[frame.camera].scheduler.on_inference(
+                frame.timestamp, started, finished
+            )
+        return results
+
+    def _postprocess(self, items):
+        for frame, detections in items:
+            started = time.monotonic()
+            if detections is not None:
+                # Umur frame saat hasil inference siap (capture -> hasil)
+                self.latency.record("detection_age", started - frame.timestamp)
+
+            self._process_detections(self.cameras[frame.camera], frame, detections)
+            self.latency.record("postprocess", time.monotonic() - started)
+
+    def _process_detections(self, camera, frame, detections):
+        predicted = detections is None
+
+        if predicted:
+            detections = camera.tracker.predict(frame.timestamp)
+        elif camera.tracker:
+            detections = camera.tracker.update(detections, frame.timestamp)
+
+        if not predicted:
+            camera.latest_detections = detections
+
+        if camera.spray_registry:
+            camera.spray_registry.follow(detections)
+
+        if not len(detections):
+            return
+
+        zone_mapper = camera.zone_mapper
+        height, width = frame.image.shape[:2]
+        zone_index = zone_mapper.assign(detections.xyxy, width)
+        camera.zone_occupancy = zone_mapper.occupancy(zone_index)
+        targets = self.target_selector.rank(
+            detections, width, height, zone_index, zone_mapper.names
         )
 
-        self.cap = cv2.VideoCapture(source)
-        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
-        self.cap.set(cv2.CAP_PROP_FPS, 30)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if not predicted and len(targets):
+            best = targets[0]
+            name = detections.labels[best]
+            conf = float(detections.conf[best])
+            position = zone_mapper.names[zone_index[best]]
+            occupancy = zone_mapper.describe(camera.zone_occupancy)
+            prefix = f"[CAM {camera.index}] " if len(self.cameras) > 1 else ""
+            self.detection_ready.emit(
+                f"{prefix}{name} ({conf:.2f}) | {position} | {occupancy}"
+            )
 
-    def run(self):
-        self.running = True
+        self._actuate(camera, frame, detections, targets, zone_index)
 
-        while self.running:
-            ret, frame = self.cap.read()
-            if not ret:
+    def _actuate(self, camera, frame, detections, targets, zone_index):
+        """Spray target prioritas tertinggi yang belum di-spray dan lolos lidar."""
+        spray_registry = camera.spray_registry
+        for index in targets:
+            box = detections.xyxy[index]
+            track_id = (
+                detections.track_id[index] if detections.track_id is not None else None
+            )
+            position = camera.zone_mapper.names[zone_index[index]]
+
+            if spray_registry and spray_registry.is_sprayed(
+                track_id, box, frame.timestamp
+            ):
                 continue
 
-            self.counter += 1
-            do_detect = self.counter % self.frame_skip == 0
+            if not self._is_distance_valid(position):
+                continue
 
-            if do_detect:
-                results = self.model.predict(
-                    frame,
-                    verbose=False,
-                    imgsz=640,
-                    device="cpu",
-                )
-                annotated = results[0].plot()
-            else:
-                annotated = frame
+            sent = self._send_serial_message(position, frame.timestamp)
+            if sent and spray_registry:
+                spray_registry.mark(track_id, box, frame.timestamp)
+            return
+
+    def set_display_size(self, width, height):
+        """
+        Ukuran area tampilan GUI. Frame di-resize ke ukuran ini di render
+        stage, sehingga GUI thread tidak perlu men-scale pixmap.
+        """
+        self.display_size = (width, height) if width > 0 and height > 0 else None
+
+    def _display_scale(self, width, height):
+        if self.display_size is None:
+            return 1.0
+        display_width, display_height = self.display_size
+        scale = min(display_width / width, display_height / height)
+        return 1.0 if abs(scale - 1.0) < 0.01 else scale
+
+    def _interpolation(self, scale):
+        """fast: bilinear. smooth: area saat mengecilkan, bicubic saat membesarkan."""
+        if self.display_interpolation != "smooth":
+            return cv2.INTER_LINEAR
+        return cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+
+    def _annotate(self, frame):
+        """
+        Gambar deteksi di setiap frame kamera: posisi prediksi tracker
+        jika tracking aktif, atau deteksi terakhir (cache) jika tidak.
+        Frame di-resize ke ukuran display lebih dulu, box & overlay
+        digambar langsung di ukuran display.
+        """
+        started = time.monotonic()
+        camera = self.cameras[frame.camera]
+        spray_registry = camera.spray_registry
+        if camera.tracker:
+            detections = camera.tracker.predict(frame.timestamp)
+        else:
+            detections = camera.latest_detections
+
+        has_boxes = (
+            detections is not None
+            and len(detections) > 0
+            and frame.timestamp - detections.timestamp <= self.detection_hold
+        )
+        has_overlay = self.spray_overlay and len(spray_registry) > 0
+
+        height, width = frame.image.shape[:2]
+        scale = self._display_scale(width, height)
+
+        if scale == 1.0 and not has_boxes and not has_overlay:
+            self.latency.record("annotate", time.monotonic() - started)
+            return self.frame_pool.share(frame.image)
+
+        # Frame dipakai bersama dengan stage inference, jangan digambar langsung:
+        # salin / resize ke buffer pool lalu gambar di sana.
+        size = (round(width * scale), round(height * scale))
+        display = self.frame_pool.acquire((size[1], size[0], 3))
+        if display is None:
+            return None
+        annotated = display.array
+        copy_started = time.monotonic()
+        if scale == 1.0:
+            np.copyto(annotated, frame.image)
+        else:
+            cv2.resize(
+                frame.image,
+                size,
+                dst=annotated,
+                interpolation=self._interpolation(scale),
+            )
+        copied = time.monotonic()
 
-            rgb = cv2.cvtColor(annotated, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb.shape
-            qt_image = QImage(rgb.data, w, h, ch * w, QImage.Format_RGB888)
-            self.frame_ready.emit(qt_image)
+        if has_overlay:
+            spray_registry.apply_overlay(annotated, scale)
 
-            if do_detect and results[0].boxes:
-                cls = int(results[0].boxes[0].cls)
-                name = results[0].names[cls]
-                conf = float(results[0].boxes[0].conf)
-                box = results[0].boxes[0]
-                position = self.get_object_position(frame.shape[1], box)
+        if has_boxes:
+            draw_boxes_on_frame(
+                annotated,
+                detections.xyxy * scale,
+                detections.display_labels,
+                detections.conf,
+            )
 
-                self.detection_ready.emit(f"{name} ({conf:.2f}) | {position}")
+        # display_copy menggantikan konversi BGR->RGB (copy/resize ke buffer pool)
+        self.latency.record("display_copy", copied - copy_started)
+        self.latency.record(
+            "annotate", (copy_started - started) + (time.monotonic() - copied)
+        )
+        return display
+
+    def _render(self, frame):
+        """
+        Kirim frame BGR ke GUI tanpa konversi warna. Jika GUI masih memegang
+        semua buffer pool, frame ini di-drop.
+        """
+        display = self._annotate(frame)
+        if display is None:
+            return
+
+        started = time.monotonic()
+        self.frame_ready.emit(display)
+        finished = time.monotonic()
+        self.latency.record("emit", finished - started)
+        self.latency.record("display_age", finished - frame.timestamp)
+
+    def pipeline_stats(self):
+        """Queue depth, drop count dan jumlah item per stage (dan per kamera)."""
+        stats = {}
+        multi_camera = len(self.cameras) > 1
+        for camera in self.cameras:
+            for key, value in camera.stats().items():
+                stats[f"{key}{camera.index}" if multi_camera else key] = value
+        for stage in self.stages:
+            stats[stage.name] = stage.stats()
+        stats["display"] = self.frame_pool.stats()
+        return stats
+
+    def performance(self, latency):
+        """Metrik panel dashboard; rate dihitung dari selisih counter kumulatif."""
+        captured = sum(
+            camera.capture_thread.frame_count
+            for camera in self.cameras
+            if camera.capture_thread
+        )
+        rates = self.rates.update(
+            time.monotonic(),
+            {
+                "camera_fps": captured / len(self.cameras),  # rata-rata per kamera
+                "detection_fps": self.inferred_frames,
+                "lidar_left_hz": self.lidar_samples["LEFT"],
+                "lidar_right_hz": self.lidar_samples["RIGHT"],
+            },
+        )
+        predict = latency.get("predict")
+        return {
+            **rates,
+            "inference_ms": predict["p50"] if predict else None,
+            "dropped": sum(stage.input_queue.dropped for stage in self.stages)
+            + self.frame_pool.dropped,
+            "serial_sent": self.serial_sent,
+            "serial_skipped_busy": self.serial_skipped_busy,
+        }
+
+    def sources_finished(self):
+        """True jika semua sumber replay (tanpa loop) sudah habis."""
+        return all(
+            camera.capture_thread and camera.capture_thread.finished
+            for camera in self.cameras
+        )
 
-                if self._is_distance_valid(position):
-                    print(f"======send to serial======={position}=======")
-                    self._send_serial_message(position)
+    def _acquire_model(self):
+        """Ambil engine dari registry (sudah di-preload & warm-up saat app start)."""
+        if not model_registry.is_ready(
+            self.model_name, self.backend, self.inference_threads
+        ):
+            self.detection_ready.emit(
+                f"[INFO] Loading model {self.model_name} ({self.backend})..."
+            )
+
+        try:
+            self.engine = model_registry.get(
+                self.model_name,
+                self.model_imgsz,
+                self.backend,
+                self.inference_threads,
+                self.inference_cpus,
+            )
+        except RuntimeError as e:
+            self.detection_ready.emit(f"[ERROR] {e}")
+            return False
+
+        add_log(
+            LogLevel.INFO.value,
+            LogSource.CORE_INFERENCE.value,
+            f"Inference {self.backend}: threads {self.engine.threads}, "
+            f"cpus {self.inference_cpus or 'all'}, io cpus {self.io_cpus or 'all'}",
+        )
+        return True
+
+    def run(self):
+        self.running = True
+        if not self._acquire_model() or not self.running:
+            self.running = False
+            return
+
+        for camera in self.cameras:
+            camera.capture_thread.start()
+        for stage in self.stages:
+            stage.start()
+
+        ticks = 0
+        replay_finished = False
+        last_latency_log = time.monotonic()
+        while self.running:
+            self.msleep(100)
+            ticks += 1
+            if not replay_finished and self.sources_finished():
+                replay_finished = True
+                self.detection_ready.emit("[INFO] Replay source finished")
+            if ticks % 10 == 0 and self.running:
+                self.stats_ready.emit(self.pipeline_stats())
+                latency = self.latency.summary()
+                self.latency_ready.emit(latency)
+                performance_metrics.publish(self.performance(latency))
+
+                now = time.monotonic()
+                if self.latency_log_interval and (
+                    now - last_latency_log >= self.latency_log_interval
+                ):
+                    last_latency_log = now
+                    print(f"[Latency] p50/p95/p99 ms: {format_latency(latency)}")
 
     def stop(self):
         self.running = False
-        if self.cap:
-            self.cap.release()
+        for camera in self.cameras:
+            camera.stop()
+        for stage in self.stages:
+            stage.stop()
         self.quit()
-        self.wait(200)
+        self.wait(500)
+        performance_metrics.clear()
@@ -0,0 +1,64 @@
+import signal
+import sys
+
+from PyQt5.QtCore import QCoreApplication, QTimer
+
+from controller.model_registry import preload_configured_model
+from controller.yolo import YOLOThreadController
+from enums.log import LogLevel, LogSource
+from utils.logger import add_log
+
+
+def run_headless():
+    """
+    Pipeline capture -> inference -> lidar -> serial tanpa widget dan tanpa
+    render/QImage, untuk systemd service. Return exit code: non-zero jika
+    pipeline berhenti sendiri (mis. model gagal di-load) agar systemd restart.
+    """
+    app = QCoreApplication(sys.argv)
+    preload_configured_model()
+
+    controller = YOLOThreadController(headless=True)
+    stopping = False
+
+    def shutdown(*_):
+        nonlocal stopping
+        stopping = True
+        add_log(LogLevel.INFO.value, LogSource.MAIN.value, "Headless pipeline stopping")
+        controller.stop()
+        app.quit()
+
+    def on_finished():
+        if not stopping:
+            add_log(
+                LogLevel.ERROR.value,
+                LogSource.MAIN.value,
+                "Headless pipeline stopped unexpectedly",
+            )
+            app.exit(1)
+
+    def on_message(message):
+        # Deteksi per frame tidak ditulis ke log service, hanya status/error
+        if message.startswith(("[INFO]", "[WARNING]", "[ERROR]")):
+            print(message, flush=True)
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    # Beri interpreter kesempatan menjalankan signal handler Python
+    # selama event loop Qt berjalan.
+    signal_timer = QTimer()
+    signal_timer.timeout.connect(lambda: None)
+    signal_timer.start(500)
+
+    controller.detection_ready.connect(on_message)
+    controller.finished.connect(on_finished)
+    controller.setup()
+    controller.start()
+
+    add_log(LogLevel.INFO.value, LogSource.MAIN.value, "Headless pipeline started")
+    return app.exec_()
+
+
+if __name__ == "__main__":
+    sys.exit(run_headless())
@@ -1,11 +1,21 @@
 import sys
-from PyQt5.QtWidgets import QApplication
 
-from views.main import MainWindow
+from controller.model_registry import preload_configured_model
 
 
 def main():
+    if "--headless" in sys.argv:
+        from headless import run_headless
+
+        sys.exit(run_headless())
+
+    # Modul widget (dan dependensinya) hanya di-import untuk mode GUI
+    from PyQt5.QtWidgets import QApplication
+
+    from views.main import MainWindow
+
     app = QApplication(sys.argv)
+    preload_configured_model()
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
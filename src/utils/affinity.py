@@ -0,0 +1,64 @@
+import os
+from contextlib import contextmanager
+
+
+def available_cpus():
+    """CPU yang boleh dipakai proses ini."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def plan_affinity(inference_cpus=None, io_cpus=None, threads=0):
+    """
+    Bagi core antara inference dan thread I/O (capture, stage lain, serial,
+    lidar). Return (threads, inference_cpus, io_cpus); None = tidak di-pin.
+
+    inference_cpus kosong : tidak ada pinning sama sekali
+    io_cpus kosong        : thread I/O memakai sisa core di luar inference
+    threads 0             : jumlah core inference, atau default runtime
+    """
+    available = available_cpus()
+    inference = [cpu for cpu in inference_cpus or [] if cpu in available] or None
+
+    if io_cpus:
+        io = [cpu for cpu in io_cpus if cpu in available] or None
+    elif inference:
+        io = [cpu for cpu in available if cpu not in inference] or None
+    else:
+        io = None
+
+    if not threads and inference:
+        threads = len(inference)
+    return threads, inference, io
+
+
+def pin_current_thread(cpus):
+    """
+    Pin thread pemanggil ke cpus (Linux). Thread yang dibuat setelahnya
+    (mis. thread pool runtime inference) mewarisi affinity ini.
+    Return CPU efektif, atau None jika tidak di-pin.
+    """
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return None
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError as e:
+        print(f"[Affinity] Failed to pin to CPUs {cpus}: {e}")
+        return None
+    return sorted(os.sched_getaffinity(0))
+
+
+@contextmanager
+def pinned(cpus):
+    """Pin sementara, lalu kembalikan affinity thread pemanggil."""
+    previous = None
+    if cpus and hasattr(os, "sched_getaffinity"):
+        previous = os.sched_getaffinity(0)  # sebelum di-pin
+        if not pin_current_thread(cpus):
+            previous = None
+    try:
+        yield
+    finally:
+        if previous:
+            os.sched_setaffinity(0, previous)
@@ -0,0 +1,61 @@
+import numpy as np
+
+
+class Detections:
+    """
+    Hasil deteksi dalam bentuk array NumPy ringkas.
+    xyxy  : (N, 4) float32, koordinat pixel pada frame yang di-inference
+    conf  : (N,)   float32
+    cls   : (N,)   int32
+    names : dict {class_id: nama}
+    track_id : (N,) int64 dari ObjectTracker, None jika tidak di-track
+    """
+
+    __slots__ = ("xyxy", "conf", "cls", "names", "timestamp", "track_id")
+
+    def __init__(self, xyxy, conf, cls, names, timestamp=0.0, track_id=None):
+        self.xyxy = xyxy
+        self.conf = conf
+        self.cls = cls
+        self.names = names
+        self.timestamp = timestamp  # timestamp frame asal deteksi
+        self.track_id = track_id
+
+    @classmethod
+    def empty(cls, names=None, timestamp=0.0):
+        return cls(
+            np.zeros((0, 4), dtype=np.float32),
+            np.zeros((0,), dtype=np.float32),
+            np.zeros((0,), dtype=np.int32),
+            names or {},
+            timestamp,
+        )
+
+    @classmethod
+    def from_ultralytics(cls, result, timestamp=0.0):
+        """Konversi ultralytics Results ke array NumPy (satu kali per tensor)."""
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return cls.empty(result.names, timestamp)
+
+        return cls(
+            boxes.xyxy.cpu().numpy().astype(np.float32, copy=False),
+            boxes.conf.cpu().numpy().astype(np.float32, copy=False),
+            boxes.cls.cpu().numpy().astype(np.int32),
+            result.names,
+            timestamp,
+        )
+
+    def __len__(self):
+        return len(self.conf)
+
+    @property
+    def labels(self):
+        return [self.names.get(int(c), str(int(c))) for c in self.cls]
+
+    @property
+    def display_labels(self):
+        """Label untuk overlay, ditambah ID track jika ada."""
+        if self.track_id is None:
+            return self.labels
+        return [f"{label} #{tid}" for label, tid in zip(self.labels, self.track_id)]
@@ -0,0 +1,83 @@
+import threading
+from collections import deque
+
+
+class BoundedQueue:
+    """
+    Queue dengan kapasitas tetap dan policy drop-oldest.
+    Jika penuh, item paling lama dibuang (dihitung sebagai drop)
+    sehingga producer tidak pernah ter-block oleh consumer yang lambat.
+    """
+
+    def __init__(self, maxsize=1):
+        self._cond = threading.Condition()
+        self._items = deque()
+        self.maxsize = maxsize
+        self.dropped = 0
+
+    def put(self, item):
+        """Tambah item, buang item paling lama jika queue penuh."""
+        with self._cond:
+            if len(self._items) >= self.maxsize:
+                self._items.popleft()
+                self.dropped += 1
+            self._items.append(item)
+            self._cond.notify()
+
+    def get(self, timeout=None):
+        """Ambil item paling lama. Return None jika timeout."""
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            if not self._items:
+                return None
+            return self._items.popleft()
+
+    def clear(self):
+        """Kosongkan queue."""
+        with self._cond:
+            self._items.clear()
+
+    @property
+    def depth(self):
+        return len(self._items)
+
+
+class FrameBatcher:
+    """
+    Satu slot per kamera untuk batched inference.
+    put() menimpa frame lama dari kamera yang sama (dihitung sebagai drop),
+    get() menunggu sampai ada frame lalu mengambil frame terbaru dari semua
+    kamera sekaligus sebagai list.
+    """
+
+    def __init__(self, slots):
+        self._cond = threading.Condition()
+        self._frames = [None] * slots
+        self.dropped = 0
+
+    def put(self, frame):
+        with self._cond:
+            if self._frames[frame.camera] is not None:
+                self.dropped += 1
+            self._frames[frame.camera] = frame
+            self._cond.notify()
+
+    def get(self, timeout=None):
+        """List frame terbaru per kamera. Return None jika timeout."""
+        with self._cond:
+            if self.depth == 0:
+                self._cond.wait(timeout)
+            batch = [frame for frame in self._frames if frame is not None]
+            if not batch:
+                return None
+            self._frames = [None] * len(self._frames)
+            return batch
+
+    def clear(self):
+        with self._cond:
+            self._frames = [None] * len(self._frames)
+
+    @property
+    def depth(self):
+        return sum(frame is not None for frame in self._frames)
@@ -0,0 +1,81 @@
+import threading
+
+import numpy as np
+from PyQt5.QtGui import QImage
+
+
+class DisplayFrame:
+    """
+    QImage BGR888 yang membungkus array NumPy tanpa copy / konversi warna.
+    Array tetap hidup selama objek ini ada; GUI wajib memanggil release()
+    setelah QPixmap dibuat (QPixmap.fromImage adalah satu-satunya copy).
+    """
+
+    __slots__ = ("array", "image", "_pool", "_pooled")
+
+    def __init__(self, array, pool, pooled):
+        self.array = array
+        self._pool = pool
+        self._pooled = pooled
+        height, width = array.shape[:2]
+        self.image = QImage(
+            array.data, width, height, array.strides[0], QImage.Format_BGR888
+        )
+
+    def release(self):
+        if self._pool is not None:
+            self._pool._release(self.array, self._pooled)
+            self._pool = None
+
+
+class FramePool:
+    """
+    Buffer preallocated untuk hand-off frame ke GUI.
+
+    acquire(shape) : pinjam buffer writable (untuk frame yang digambari box)
+    share(array)   : bungkus frame kamera apa adanya (read-only, tanpa copy)
+
+    Maksimal `size` frame boleh berada di GUI sekaligus. Jika GUI belum
+    mengembalikan frame, frame baru di-drop (dihitung) alih-alih menumpuk
+    di event queue Qt.
+    """
+
+    def __init__(self, size=3):
+        self.size = size
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._free = []
+        self._shape = None
+        self._in_flight = 0
+
+    def acquire(self, shape):
+        with self._lock:
+            if not self._reserve():
+                return None
+            if shape != self._shape:
+                self._shape = shape
+                self._free = []
+            buffer = self._free.pop() if self._free else np.empty(shape, np.uint8)
+        return DisplayFrame(buffer, self, pooled=True)
+
+    def share(self, array):
+        with self._lock:
+            if not self._reserve():
+                return None
+        return DisplayFrame(array, self, pooled=False)
+
+    def _reserve(self):
+        if self._in_flight >= self.size:
+            self.dropped += 1
+            return False
+        self._in_flight += 1
+        return True
+
+    def _release(self, array, pooled):
+        with self._lock:
+            self._in_flight -= 1
+            if pooled and array.shape == self._shape:
+                self._free.append(array)
+
+    def stats(self):
+        return {"in_flight": self._in_flight, "dropped": self.dropped}
@@ -0,0 +1,58 @@
+import threading
+
+import numpy as np
+
+
+class LatencyRecorder:
+    """
+    Rolling histogram durasi per stage (ring buffer `window` sampel terakhir).
+    record() murah (tulis satu float), percentile dihitung saat summary().
+    """
+
+    def __init__(self, window=512):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {}  # stage -> np.ndarray (window,)
+        self._counts = {}  # stage -> total sampel sejak start
+
+    def record(self, stage, seconds):
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = np.empty(self.window)
+                self._counts[stage] = 0
+            samples[self._counts[stage] % self.window] = seconds
+            self._counts[stage] += 1
+
+    def summary(self):
+        """{stage: {"p50", "p95", "p99" (ms), "count"}}"""
+        with self._lock:
+            counts = dict(self._counts)
+            snapshot = [
+                (stage, samples[: min(counts[stage], self.window)].copy())
+                for stage, samples in self._samples.items()
+            ]
+
+        summary = {}
+        for stage, samples in snapshot:
+            p50, p95, p99 = np.percentile(samples, (50, 95, 99)) * 1000
+            summary[stage] = {
+                "p50": round(float(p50), 2),
+                "p95": round(float(p95), 2),
+                "p99": round(float(p99), 2),
+                "count": counts[stage],
+            }
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+
+def format_latency(summary):
+    """Satu baris log: "predict 12.1/15.0/20.3 | ..." (p50/p95/p99 ms)."""
+    return " | ".join(
+        f"{stage} {value['p50']}/{value['p95']}/{value['p99']}"
+        for stage, value in summary.items()
+    )
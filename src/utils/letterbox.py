@@ -0,0 +1,67 @@
+import cv2
+
+
+def _ceil_to_stride(value, stride):
+    return max(stride, -(-int(round(value)) // stride) * stride)
+
+
+def _scaled_size(frame_width, frame_height, imgsz):
+    """Sisi panjang = imgsz (tanpa upscale), aspect ratio tetap."""
+    scale = min(imgsz / max(frame_width, frame_height), 1.0)
+    return round(frame_width * scale), round(frame_height * scale)
+
+
+def inference_shape(frame_width, frame_height, imgsz=640, rect=True, stride=32):
+    """
+    Ukuran input model (width, height) untuk frame kamera tertentu.
+
+    rect=True  : sisi panjang = imgsz, sisi pendek mengikuti aspect ratio
+                 kamera lalu di-pad ke kelipatan stride berikutnya (maks.
+                 stride - 1 baris/kolom), bukan di-stretch.
+                 Frame yang lebih kecil dari imgsz tidak di-upscale.
+    rect=False : input persegi imgsz x imgsz (model akan mem-pad frame).
+    """
+    if not rect:
+        return imgsz, imgsz
+
+    width, height = _scaled_size(frame_width, frame_height, imgsz)
+    return _ceil_to_stride(width, stride), _ceil_to_stride(height, stride)
+
+
+def capture_shape(frame_width, frame_height, imgsz=640, rect=True, stride=32):
+    """
+    Ukuran frame (width, height) setelah di-downscale di capture stage:
+    sisi panjang = imgsz dengan aspect ratio kamera. Sisa ke ukuran input
+    model (kelipatan stride / persegi) ditambahkan sebagai padding oleh
+    letterbox, sehingga frame dan box di display tidak terdistorsi.
+    """
+    return _scaled_size(frame_width, frame_height, imgsz)
+
+
+def letterbox(image, new_shape, color=(114, 114, 114)):
+    """
+    Resize dengan aspect ratio tetap lalu pad ke new_shape (height, width).
+    Return (image, ratio, (pad_left, pad_top)) untuk memetakan box kembali.
+    Jika frame sudah persis new_shape, tidak ada resize/pad.
+    """
+    height, width = image.shape[:2]
+    new_height, new_width = new_shape
+    ratio = min(new_height / height, new_width / width)
+
+    resized_width, resized_height = round(width * ratio), round(height * ratio)
+    if (resized_width, resized_height) != (width, height):
+        image = cv2.resize(
+            image, (resized_width, resized_height), interpolation=cv2.INTER_LINEAR
+        )
+
+    pad_w = (new_width - resized_width) / 2
+    pad_h = (new_height - resized_height) / 2
+    top, bottom = int(round(pad_h - 0.1)), int(round(pad_h + 0.1))
+    left, right = int(round(pad_w - 0.1)), int(round(pad_w + 0.1))
+
+    if top or bottom or left or right:
+        image = cv2.copyMakeBorder(
+            image, top, bottom, left, right, cv2.BORDER_CONSTANT, value=color
+        )
+
+    return image, ratio, (left, top)
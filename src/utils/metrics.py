@@ -0,0 +1,79 @@
+import threading
+
+THERMAL_ZONE = "/sys/class/thermal/thermal_zone0/temp"
+
+
+class PerformanceMetrics:
+    """
+    Snapshot performa pipeline terbaru untuk panel dashboard.
+    YOLOThreadController memanggil publish() sekali per detik, GUI membaca
+    snapshot() dengan timer-nya sendiri; keduanya hanya menukar satu dict.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = None
+
+    def publish(self, snapshot):
+        with self._lock:
+            self._snapshot = snapshot
+
+    def clear(self):
+        with self._lock:
+            self._snapshot = None
+
+    def snapshot(self):
+        """Dict metrik terakhir, atau None jika pipeline tidak berjalan."""
+        with self._lock:
+            return self._snapshot
+
+
+class RateCounter:
+    """Ubah counter kumulatif menjadi rate per detik antar pemanggilan."""
+
+    def __init__(self):
+        self._last = None  # (timestamp, {name: value})
+
+    def update(self, timestamp, counters):
+        last, self._last = self._last, (timestamp, dict(counters))
+        if last is None or timestamp <= last[0]:
+            return {name: 0.0 for name in counters}
+
+        elapsed = timestamp - last[0]
+        return {
+            name: round((value - last[1].get(name, 0)) / elapsed, 1)
+            for name, value in counters.items()
+        }
+
+
+class CpuLoad:
+    """Persentase CPU terpakai dari selisih /proc/stat antar pemanggilan."""
+
+    def __init__(self):
+        self._last = None
+
+    def percent(self):
+        try:
+            with open("/proc/stat") as f:
+                values = [int(value) for value in f.readline().split()[1:]]
+        except (OSError, ValueError):
+            return None
+
+        idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+        total = sum(values)
+        last, self._last = self._last, (idle, total)
+        if last is None or total == last[1]:
+            return None
+        return round(100.0 * (1 - (idle - last[0]) / (total - last[1])), 1)
+
+
+def soc_temperature():
+    """Suhu SoC (°C) dari thermal zone kernel, None jika tidak tersedia."""
+    try:
+        with open(THERMAL_ZONE) as f:
+            return round(int(f.read().strip()) / 1000.0, 1)
+    except (OSError, ValueError):
+        return None
+
+
+performance_metrics = PerformanceMetrics()
@@ -0,0 +1,172 @@
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+LOG_DIR = os.path.join(os.getcwd(), "logs")
+
+
+def _log_path(prefix, extension):
+    os.makedirs(LOG_DIR, exist_ok=True)
+    name = f"{prefix}_{datetime.now():%Y%m%d_%H%M%S}.{extension}"
+    return os.path.join(LOG_DIR, name)
+
+
+class SamplingProfiler:
+    """
+    Sampling profiler untuk semua thread Python (capture, stage pipeline,
+    serial, lidar, GUI) tanpa restart: setiap `interval` detik stack tiap
+    thread diambil dari sys._current_frames(). Overhead hanya saat aktif.
+
+    Hasil stop() ditulis ke logs/profile_<timestamp>.txt:
+    ringkasan fungsi teratas per thread, lalu stack dalam format collapsed
+    ("thread;fungsi;...;fungsi count") yang bisa dibuka flamegraph.pl /
+    speedscope.
+    """
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._thread = None
+        self._running = False
+        self._started = None
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        if self._running:
+            return
+        self.stacks = Counter()
+        self.samples = 0
+        self._running = True
+        self._started = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="profiler", daemon=True
+        )
+        self._thread.start()
+
+    def _sample_loop(self):
+        own = threading.get_ident()
+        while self._running:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    file = os.path.basename(code.co_filename)
+                    stack.append(f"{code.co_name} ({file}:{frame.f_lineno})")
+                    frame = frame.f_back
+                thread = names.get(ident, f"thread-{ident}")
+                self.stacks[(thread,) + tuple(reversed(stack))] += 1
+            self.samples += 1
+            time.sleep(self.interval)
+
+    def stop(self):
+        """Stop sampling dan tulis hasil. Return path file (None jika tidak aktif)."""
+        if not self._running:
+            return None
+        self._running = False
+        self._thread.join()
+        duration = time.monotonic() - self._started
+
+        path = _log_path("profile", "txt")
+        with open(path, "w") as f:
+            f.write(
+                f"# {self.samples} samples in {duration:.1f}s "
+                f"(interval {self.interval * 1000:.0f} ms)\n"
+            )
+            for line in self._summary():
+                f.write(f"# {line}\n")
+            f.write("\n")
+            for stack, count in self.stacks.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+        return path
+
+    def _summary(self, top=10):
+        """Fungsi paling sering berada di puncak stack (self time) per thread."""
+        threads = {}
+        for stack, count in self.stacks.items():
+            threads.setdefault(stack[0], Counter())[stack[-1]] += count
+
+        lines = []
+        for thread, functions in sorted(threads.items()):
+            total = sum(functions.values())
+            lines.append(f"{thread} ({total} samples)")
+            for function, count in functions.most_common(top):
+                lines.append(f"  {count / total * 100:5.1f}%  {function}")
+        return lines
+
+
+class MemoryProfiler:
+    """
+    Snapshot tracemalloc on-demand. Tracing hanya aktif antara start() dan
+    stop() (memperlambat alokasi) dan hanya melihat alokasi setelah start().
+    Setiap snapshot ditulis ke logs/memory_<timestamp>.txt beserta selisih
+    terhadap snapshot sebelumnya, dan versi mentah .tracemalloc untuk
+    analisa offline.
+    """
+
+    def __init__(self, frames=10, top=30):
+        self.frames = frames
+        self.top = top
+        self._previous = None
+
+    @property
+    def tracing(self):
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        if tracemalloc.is_tracing():
+            return
+        tracemalloc.start(self.frames)
+        self._previous = self._take()
+
+    def _take(self):
+        # Alokasi milik tracemalloc sendiri tidak relevan
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+
+    def snapshot(self):
+        """Tulis snapshot, return path file (None jika tracing tidak aktif)."""
+        if not tracemalloc.is_tracing():
+            return None
+
+        snapshot = self._take()
+        current, peak = tracemalloc.get_traced_memory()
+
+        path = _log_path("memory", "txt")
+        snapshot.dump(path.replace(".txt", ".tracemalloc"))
+        with open(path, "w") as f:
+            f.write(
+                f"# traced {current / 1024 / 1024:.1f} MB, "
+                f"peak {peak / 1024 / 1024:.1f} MB\n\n"
+            )
+            f.write(f"# Top {self.top} allocations by line\n")
+            for stat in snapshot.statistics("lineno")[: self.top]:
+                f.write(f"{stat}\n")
+
+            if self._previous is not None:
+                f.write(f"\n# Top {self.top} changes since previous snapshot\n")
+                for stat in snapshot.compare_to(self._previous, "lineno")[: self.top]:
+                    f.write(f"{stat}\n")
+
+        self._previous = snapshot
+        return path
+
+    def stop(self):
+        self._previous = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+sampling_profiler = SamplingProfiler()
+memory_profiler = MemoryProfiler()
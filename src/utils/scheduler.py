@@ -0,0 +1,127 @@
+import math
+
+
+class FrameSkipScheduler:
+    """
+    Tentukan frame kamera mana yang dikirim ke inference.
+
+    Skip tidak lagi angka tetap, tapi dihitung ulang dari FPS kamera dan
+    latency inference yang terukur:
+    - mode "fps"     : kejar target rate deteksi, dibatasi rate yang
+                       sanggup dicapai model.
+    - mode "latency" : jalan secepat mungkin tanpa antrian di depan model,
+                       dan laporkan jika umur frame (capture -> hasil
+                       deteksi) melewati budget.
+    fixed_skip > 0 mematikan mode adaptif (perilaku lama `counter % skip`).
+    """
+
+    def __init__(
+        self,
+        target_fps=10,
+        mode="fps",
+        latency_budget_ms=150,
+        fixed_skip=0,
+        max_skip=30,
+        smoothing=0.2,
+    ):
+        self.target_fps = max(float(target_fps), 0.1)
+        self.mode = mode
+        self.latency_budget = latency_budget_ms / 1000.0
+        self.fixed_skip = int(fixed_skip)
+        self.max_skip = max_skip
+        self.smoothing = smoothing
+
+        self.skip = self.fixed_skip if self.fixed_skip > 0 else 1
+        self.camera_fps = None
+        self.inference_latency = None
+        self.frame_age = None
+        self.over_budget = False
+
+        self._last_frame = None  # (index, timestamp)
+        self._last_dispatched = None
+
+    def should_detect(self, frame):
+        """Dipanggil untuk setiap frame yang diambil stage inference. True = kirim ke model."""
+        self._observe_frame(frame.index, frame.timestamp)
+
+        if (
+            self._last_dispatched is not None
+            and frame.index - self._last_dispatched < self.skip
+        ):
+            return False
+
+        self._last_dispatched = frame.index
+        return True
+
+    def on_inference(self, frame_timestamp, started, finished):
+        """Laporkan waktu inference satu frame (semua time.monotonic())."""
+        self.inference_latency = self._ema(self.inference_latency, finished - started)
+        self.frame_age = self._ema(self.frame_age, finished - frame_timestamp)
+
+        if self.fixed_skip > 0:
+            return
+
+        if self.mode == "latency":
+            self._update_latency_mode()
+        else:
+            self._update_fps_mode()
+
+    def _observe_frame(self, index, timestamp):
+        if self._last_frame is not None:
+            last_index, last_timestamp = self._last_frame
+            elapsed = timestamp - last_timestamp
+            if index > last_index and elapsed > 0:
+                fps = (index - last_index) / elapsed
+                self.camera_fps = self._ema(self.camera_fps, fps)
+        self._last_frame = (index, timestamp)
+
+    def _update_fps_mode(self):
+        if not self.camera_fps or not self.inference_latency:
+            return
+
+        sustainable_fps = 1.0 / self.inference_latency
+        detect_fps = min(self.target_fps, sustainable_fps)
+        self._set_skip(self._ceil(self.camera_fps / detect_fps))
+
+    def _update_latency_mode(self):
+        """
+        Kirim frame secepat mungkin tanpa pernah antri di depan model,
+        sehingga umur frame = latency inference saja. Jika latency model
+        sendiri sudah melebihi budget, skip tidak bisa membantu -> warning.
+        """
+        if not self.camera_fps or not self.inference_latency:
+            return
+
+        self._set_skip(self._ceil(self.camera_fps * self.inference_latency))
+
+        over_budget = self.frame_age > self.latency_budget
+        if over_budget and not self.over_budget:
+            print(
+                f"[Scheduler] frame age {self.frame_age * 1000:.0f}ms "
+                f"over budget {self.latency_budget * 1000:.0f}ms"
+            )
+        self.over_budget = over_budget
+
+    def _ceil(self, value):
+        """ceil() dengan toleransi kecil agar skip tidak bolak-balik karena jitter."""
+        return math.ceil(value - 0.1)
+
+    def _set_skip(self, skip):
+        skip = min(max(int(skip), 1), self.max_skip)
+        if skip != self.skip:
+            print(f"[Scheduler] frame skip {self.skip} -> {skip}")
+            self.skip = skip
+
+    def _ema(self, current, value):
+        if current is None:
+            return value
+        return current + self.smoothing * (value - current)
+
+    def stats(self):
+        return {
+            "skip": self.skip,
+            "camera_fps": round(self.camera_fps or 0.0, 1),
+            "inference_ms": round((self.inference_latency or 0.0) * 1000, 1),
+            "frame_age_ms": round((self.frame_age or 0.0) * 1000, 1),
+            "over_budget": self.over_budget,
+        }
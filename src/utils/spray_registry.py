@@ -0,0 +1,215 @@
+import threading
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from utils.tracker import iou_matrix
+
+
+class SprayRegistry:
+    """
+    Registry target yang sudah di-spray (Hybrid Marking):
+    - track ID : lookup O(1) lewat dict
+    - centroid : spatial hash grid, fallback jika tracking mati (tanpa ID)
+                 atau ID baru menggantikan track yang hilang: IoU >= match_iou
+                 dengan entry di cell centroid atau 8 cell tetangganya
+    - mask     : overlay hijau area yang sudah di-spray, di-cache sampai
+                 isi registry berubah
+    Entry lama dihapus otomatis berdasarkan TTL dan jumlah maksimum.
+    """
+
+    def __init__(
+        self,
+        ttl=10.0,
+        max_entries=256,
+        cell_size=64,
+        match_iou=0.3,
+        overlay_alpha=0.35,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cell_size = cell_size
+        self.match_iou = match_iou
+        self.overlay_alpha = overlay_alpha
+
+        self._lock = threading.Lock()
+        self._next_key = 0
+        self._entries = OrderedDict()  # key -> [timestamp, track_id, box, cell]
+        self._by_track = {}  # track_id -> key
+        self._grid = {}  # cell -> set(key)
+        self._live_tracks = set()  # track ID pada follow() terakhir
+
+        self._mask = None
+        self._mask_rect = None
+        self._mask_scale = 1.0
+        self._dirty = True
+
+    def is_sprayed(self, track_id, box, timestamp):
+        """True jika target ini (ID atau lokasi) sudah di-spray."""
+        with self._lock:
+            self._evict(timestamp)
+
+            if track_id is not None:
+                if int(track_id) in self._by_track:
+                    return True
+                # ID baru: hanya sama dengan entry yang track-nya sudah
+                # hilang, bukan pohon lain yang masih ter-track
+                keys = [
+                    key
+                    for key in self._nearby(box)
+                    if self._entries[key][1] not in self._live_tracks
+                ]
+            else:
+                keys = self._nearby(box)
+
+            if not keys:
+                return False
+            boxes = np.array([self._entries[key][2] for key in keys])
+            iou = iou_matrix(np.array([box], dtype=np.float32), boxes)
+            return bool((iou >= self.match_iou).any())
+
+    def mark(self, track_id, box, timestamp):
+        """Catat target sebagai sudah di-spray."""
+        with self._lock:
+            key = self._next_key
+            self._next_key += 1
+
+            if track_id is not None:
+                track_id = int(track_id)
+
+            cell = self._cell(box)
+            self._entries[key] = [timestamp, track_id, np.array(box), cell]
+            self._grid.setdefault(cell, set()).add(key)
+            if track_id is not None:
+                self._by_track[track_id] = key
+
+            self._evict(timestamp)
+            self._dirty = True
+
+    def follow(self, detections):
+        """Geser box entry mengikuti posisi terbaru track yang sudah di-spray."""
+        if detections.track_id is None:
+            return
+
+        with self._lock:
+            self._live_tracks = {int(track_id) for track_id in detections.track_id}
+            for track_id, box in zip(detections.track_id, detections.xyxy):
+                key = self._by_track.get(int(track_id))
+                if key is None:
+                    continue
+
+                entry = self._entries[key]
+                cell = self._cell(box)
+                if cell != entry[3]:
+                    self._discard_cell(entry[3], key)
+                    self._grid.setdefault(cell, set()).add(key)
+                    entry[3] = cell
+                box = np.array(box)
+                if np.abs(box - entry[2]).max() >= 1.0:
+                    entry[2] = box
+                    self._dirty = True
+
+    def apply_overlay(self, image, scale=1.0):
+        """
+        Tint hijau area yang sudah di-spray (in-place).
+        scale: ukuran image relatif terhadap frame (display yang di-resize).
+        """
+        with self._lock:
+            mask, rect = self._overlay_mask(image.shape[:2], scale)
+
+        if rect is None:
+            return image
+
+        x1, y1, x2, y2 = rect
+        roi = image[y1:y2, x1:x2]
+        alpha = self.overlay_alpha
+        tinted = cv2.add(
+            cv2.convertScaleAbs(roi, alpha=1.0 - alpha), (0, int(255 * alpha), 0, 0)
+        )
+        np.copyto(roi, tinted, where=mask[y1:y2, x1:x2, None])
+        return image
+
+    def _overlay_mask(self, shape, scale=1.0):
+        if (
+            not self._dirty
+            and self._mask is not None
+            and self._mask.shape == shape
+            and self._mask_scale == scale
+        ):
+            return self._mask, self._mask_rect
+
+        mask = np.zeros(shape, dtype=bool)
+        height, width = shape
+        rect = None
+
+        for _, _, box, _ in self._entries.values():
+            limits = [width, height, width, height]
+            x1, y1, x2, y2 = np.clip(box * scale, 0, limits).astype(int)
+            if x2 <= x1 or y2 <= y1:
+                continue
+            mask[y1:y2, x1:x2] = True
+            if rect is None:
+                rect = [x1, y1, x2, y2]
+            else:
+                rect = [
+                    min(rect[0], x1),
+                    min(rect[1], y1),
+                    max(rect[2], x2),
+                    max(rect[3], y2),
+                ]
+
+        self._mask, self._mask_rect, self._mask_scale = mask, rect, scale
+        self._dirty = False
+        return mask, rect
+
+    def _evict(self, timestamp):
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if (
+                timestamp - entry[0] <= self.ttl
+                and len(self._entries) <= self.max_entries
+            ):
+                break
+            self._remove(key)
+
+    def _remove(self, key):
+        _, track_id, _, cell = self._entries.pop(key)
+        self._discard_cell(cell, key)
+        if track_id is not None and self._by_track.get(track_id) == key:
+            del self._by_track[track_id]
+        self._dirty = True
+
+    def _discard_cell(self, cell, key):
+        keys = self._grid.get(cell)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._grid[cell]
+
+    def _nearby(self, box):
+        """Key entry di cell centroid box dan 8 cell tetangganya."""
+        cx, cy = self._cell(box)
+        keys = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                keys.extend(self._grid.get((cx + dx, cy + dy), ()))
+        return keys
+
+    def _cell(self, box):
+        x1, y1, x2, y2 = box
+        return (
+            int((x1 + x2) / 2 // self.cell_size),
+            int((y1 + y2) / 2 // self.cell_size),
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_track.clear()
+            self._grid.clear()
+            self._live_tracks.clear()
+            self._dirty = True
@@ -0,0 +1,55 @@
+import numpy as np
+
+DEFAULT_WEIGHTS = {"zone": 1.0, "confidence": 1.0, "area": 1.0, "center": 0.5}
+
+
+class TargetSelector:
+    """
+    Priority Sorting: skor semua deteksi dalam satu pass NumPy lalu urutkan.
+
+    skor = w_zone   * bobot zone box
+         + w_conf   * confidence
+         + w_area   * luas box / luas frame
+         - w_center * jarak pusat box ke pusat frame (dinormalisasi 0..1)
+    """
+
+    def __init__(self, weights=None, zone_weights=None):
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.zone_weights = zone_weights or {}
+
+    def scores(self, detections, frame_width, frame_height, zone_index, zone_names):
+        """Skor per deteksi. zone_index: (N,) index ke zone_names, -1 = luar zone."""
+        xyxy = detections.xyxy
+        if len(xyxy) == 0:
+            return np.zeros((0,), dtype=np.float32)
+
+        w = self.weights
+
+        per_zone = np.array(
+            [self.zone_weights.get(name, 1.0) for name in zone_names] + [0.0],
+            dtype=np.float32,
+        )
+        zone_score = per_zone[zone_index]  # index -1 -> 0.0 (luar zone)
+
+        widths = xyxy[:, 2] - xyxy[:, 0]
+        heights = xyxy[:, 3] - xyxy[:, 1]
+        area = widths * heights / float(frame_width * frame_height)
+
+        cx = (xyxy[:, 0] + xyxy[:, 2]) / 2 / frame_width - 0.5
+        cy = (xyxy[:, 1] + xyxy[:, 3]) / 2 / frame_height - 0.5
+        center_dist = np.sqrt(cx * cx + cy * cy) / np.sqrt(0.5)
+
+        return (
+            w["zone"] * zone_score
+            + w["confidence"] * detections.conf
+            + w["area"] * area
+            - w["center"] * center_dist
+        )
+
+    def rank(self, detections, frame_width, frame_height, zone_index, zone_names):
+        """Index deteksi yang berada di dalam zone, urut dari prioritas tertinggi."""
+        scores = self.scores(
+            detections, frame_width, frame_height, zone_index, zone_names
+        )
+        order = np.argsort(-scores, kind="stable")
+        return order[zone_index[order] >= 0]
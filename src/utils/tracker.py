@@ -0,0 +1,207 @@
+import threading
+
+import numpy as np
+
+from utils.detection import Detections
+
+
+def iou_matrix(a, b):
+    """IoU antara setiap box di a (N, 4) dan b (M, 4) -> (N, M)."""
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros((len(a), len(b)), dtype=np.float32)
+
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - inter
+    return inter / np.maximum(union, 1e-6)
+
+
+def greedy_match(iou, threshold):
+    """Pasangkan baris/kolom dengan IoU terbesar lebih dulu."""
+    matches = []
+    if iou.size == 0:
+        return matches
+
+    used_rows, used_cols = set(), set()
+    for flat in np.argsort(-iou, axis=None):
+        row, col = divmod(int(flat), iou.shape[1])
+        if iou[row, col] < threshold:
+            break
+        if row in used_rows or col in used_cols:
+            continue
+        used_rows.add(row)
+        used_cols.add(col)
+        matches.append((row, col))
+    return matches
+
+
+class ObjectTracker:
+    """
+    Tracker ringan ala ByteTrack dengan ID stabil.
+
+    1. Deteksi high-conf dipasangkan ke prediksi posisi track (IoU).
+    2. Track yang belum dapat pasangan dicoba dengan deteksi low-conf.
+    3. Deteksi high-conf tersisa menjadi track baru.
+
+    Posisi antar frame inference diprediksi dengan model kecepatan konstan,
+    sehingga render dan aktuasi punya posisi per frame tanpa menjalankan model.
+    """
+
+    def __init__(
+        self,
+        high_conf=0.6,
+        low_conf=0.1,
+        match_iou=0.3,
+        max_age=1.0,
+        min_hits=1,
+        velocity_smoothing=0.5,
+    ):
+        self.high_conf = high_conf
+        self.low_conf = low_conf
+        self.match_iou = match_iou
+        self.max_age = max_age
+        self.min_hits = min_hits
+        self.velocity_smoothing = velocity_smoothing
+
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self.names = {}
+        self._reset_arrays()
+
+    def _reset_arrays(self):
+        self.ids = np.zeros((0,), dtype=np.int64)
+        self.boxes = np.zeros((0, 4), dtype=np.float32)
+        self.velocity = np.zeros((0, 4), dtype=np.float32)  # pixel / detik
+        self.conf = np.zeros((0,), dtype=np.float32)
+        self.cls = np.zeros((0,), dtype=np.int32)
+        self.hits = np.zeros((0,), dtype=np.int32)
+        self.last_seen = np.zeros((0,), dtype=np.float64)
+
+    def update(self, detections, timestamp):
+        """Update track dengan hasil inference. Return deteksi + track_id."""
+        with self._lock:
+            self.names = detections.names or self.names
+            predicted = self._predicted_boxes(timestamp)
+
+            high = np.flatnonzero(detections.conf >= self.high_conf)
+            low = np.flatnonzero(
+                (detections.conf < self.high_conf) & (detections.conf >= self.low_conf)
+            )
+
+            matched_tracks, matched_dets = [], []
+
+            pairs = greedy_match(
+                iou_matrix(predicted, detections.xyxy[high]), self.match_iou
+            )
+            for track, det in pairs:
+                matched_tracks.append(track)
+                matched_dets.append(high[det])
+
+            free_tracks = np.setdiff1d(
+                np.arange(len(self.ids)), matched_tracks, assume_unique=True
+            )
+            pairs = greedy_match(
+                iou_matrix(predicted[free_tracks], detections.xyxy[low]),
+                self.match_iou,
+            )
+            for track, det in pairs:
+                matched_tracks.append(free_tracks[track])
+                matched_dets.append(low[det])
+
+            self._update_matched(
+                np.array(matched_tracks, dtype=np.int64),
+                np.array(matched_dets, dtype=np.int64),
+                detections,
+                timestamp,
+            )
+
+            new_dets = np.setdiff1d(high, matched_dets, assume_unique=True)
+            self._add_tracks(new_dets, detections, timestamp)
+
+            self._remove_expired(timestamp)
+
+            updated = np.flatnonzero(self.last_seen == timestamp)
+            return self._as_detections(updated, self.boxes[updated], timestamp)
+
+    def predict(self, timestamp):
+        """Posisi prediksi semua track aktif pada timestamp tertentu."""
+        with self._lock:
+            alive = np.flatnonzero(
+                (self.hits >= self.min_hits)
+                & (timestamp - self.last_seen <= self.max_age)
+            )
+            boxes = self._predicted_boxes(timestamp)[alive]
+            return self._as_detections(alive, boxes, timestamp)
+
+    def _predicted_boxes(self, timestamp):
+        dt = np.clip(timestamp - self.last_seen, 0.0, self.max_age)
+        return self.boxes + self.velocity * dt[:, None].astype(np.float32)
+
+    def _update_matched(self, tracks, dets, detections, timestamp):
+        if len(tracks) == 0:
+            return
+
+        dt = np.maximum(timestamp - self.last_seen[tracks], 1e-3)[:, None]
+        new_boxes = detections.xyxy[dets]
+        measured = (new_boxes - self.boxes[tracks]) / dt
+        alpha = self.velocity_smoothing
+
+        self.velocity[tracks] = alpha * measured + (1 - alpha) * self.velocity[tracks]
+        self.boxes[tracks] = new_boxes
+        self.conf[tracks] = detections.conf[dets]
+        self.cls[tracks] = detections.cls[dets]
+        self.hits[tracks] += 1
+        self.last_seen[tracks] = timestamp
+
+    def _add_tracks(self, dets, detections, timestamp):
+        count = len(dets)
+        if count == 0:
+            return
+
+        ids = np.arange(self._next_id, self._next_id + count, dtype=np.int64)
+        self._next_id += count
+
+        self.ids = np.concatenate([self.ids, ids])
+        self.boxes = np.concatenate([self.boxes, detections.xyxy[dets]])
+        self.velocity = np.concatenate(
+            [self.velocity, np.zeros((count, 4), dtype=np.float32)]
+        )
+        self.conf = np.concatenate([self.conf, detections.conf[dets]])
+        self.cls = np.concatenate([self.cls, detections.cls[dets]])
+        self.hits = np.concatenate([self.hits, np.ones(count, dtype=np.int32)])
+        self.last_seen = np.concatenate(
+            [self.last_seen, np.full(count, timestamp, dtype=np.float64)]
+        )
+
+    def _remove_expired(self, timestamp):
+        keep = timestamp - self.last_seen <= self.max_age
+        if keep.all():
+            return
+
+        self.ids = self.ids[keep]
+        self.boxes = self.boxes[keep]
+        self.velocity = self.velocity[keep]
+        self.conf = self.conf[keep]
+        self.cls = self.cls[keep]
+        self.hits = self.hits[keep]
+        self.last_seen = self.last_seen[keep]
+
+    def _as_detections(self, index, boxes, timestamp):
+        return Detections(
+            boxes.astype(np.float32, copy=False),
+            self.conf[index],
+            self.cls[index],
+            self.names,
+            timestamp,
+            track_id=self.ids[index],
+        )
+
+    def reset(self):
+        with self._lock:
+            self._reset_arrays()
@@ -0,0 +1,66 @@
+import numpy as np
+
+MAX_WH = 7680  # offset per class untuk class-aware NMS
+
+
+def nms(boxes, scores, iou_threshold):
+    """Greedy non-maximum suppression. Return index box yang dipertahankan."""
+    x1, y1, x2, y2 = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    areas = (x2 - x1) * (y2 - y1)
+    order = scores.argsort()[::-1]
+
+    keep = []
+    while order.size:
+        i = order[0]
+        keep.append(i)
+        rest = order[1:]
+
+        w = np.clip(np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]), 0, None)
+        h = np.clip(np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]), 0, None)
+        inter = w * h
+        iou = inter / np.maximum(areas[i] + areas[rest] - inter, 1e-6)
+        order = rest[iou <= iou_threshold]
+
+    return np.array(keep, dtype=np.int64)
+
+
+def decode_predictions(
+    output, conf_threshold, iou_threshold, ratio, pad, image_shape, max_det=300
+):
+    """
+    Decode output mentah YOLOv8/11 (1, 4 + nc, anchors) menjadi
+    (xyxy, conf, cls) pada koordinat frame asli (sebelum letterbox).
+    """
+    pred = output[0] if output.ndim == 3 else output
+    if pred.shape[0] > pred.shape[1]:
+        pred = pred.T  # beberapa runtime mengembalikan (anchors, 4 + nc)
+
+    scores = pred[4:]
+    cls = scores.argmax(axis=0)
+    conf = scores[cls, np.arange(scores.shape[1])]
+
+    keep = conf >= conf_threshold
+    if not keep.any():
+        return (
+            np.zeros((0, 4), dtype=np.float32),
+            np.zeros((0,), dtype=np.float32),
+            np.zeros((0,), dtype=np.int32),
+        )
+
+    cx, cy, w, h = pred[:4, keep]
+    conf, cls = conf[keep], cls[keep]
+
+    pad_left, pad_top = pad
+    x1 = cx - w / 2 - pad_left
+    y1 = cy - h / 2 - pad_top
+    xyxy = np.stack([x1, y1, x1 + w, y1 + h], axis=1) / ratio
+
+    height, width = image_shape[:2]
+    np.clip(xyxy, 0, [width, height, width, height], out=xyxy)
+
+    index = nms(xyxy + cls[:, None] * MAX_WH, conf, iou_threshold)[:max_det]
+    return (
+        xyxy[index].astype(np.float32),
+        conf[index].astype(np.float32),
+        cls[index].astype(np.int32),
+    )
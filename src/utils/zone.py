@@ -0,0 +1,64 @@
+import numpy as np
+
+
+class ZoneMapper:
+    """
+    Bagi lebar frame menjadi N zone vertikal (band) yang sama lebar.
+    margin    : fraksi lebar frame di tepi kiri/kanan yang diabaikan
+    dead_zone : fraksi lebar frame di setiap batas antar zone yang diabaikan
+    Box yang pusatnya jatuh di margin / dead zone mendapat index -1.
+    """
+
+    def __init__(self, names=("LEFT", "RIGHT"), dead_zone=0.0, margin=0.0):
+        self.names = list(names)
+        self.dead_zone = dead_zone
+        self.margin = margin
+
+        self._width = None
+        self._starts = None
+        self._ends = None
+
+    def _edges(self, frame_width):
+        if frame_width == self._width:
+            return self._starts, self._ends
+
+        count = len(self.names)
+        left = self.margin * frame_width
+        right = frame_width - self.margin * frame_width
+        bounds = np.linspace(left, right, count + 1)
+        half_dead = self.dead_zone * frame_width / 2
+
+        starts = bounds[:-1].copy()
+        ends = bounds[1:].copy()
+        starts[1:] += half_dead
+        ends[:-1] -= half_dead
+
+        self._width, self._starts, self._ends = frame_width, starts, ends
+        return starts, ends
+
+    def assign(self, xyxy, frame_width):
+        """Index zone untuk setiap box (N,), -1 jika di luar zone."""
+        xyxy = _to_numpy(xyxy)
+        if len(xyxy) == 0:
+            return np.zeros((0,), dtype=np.int64)
+
+        starts, ends = self._edges(frame_width)
+        x_center = (xyxy[:, 0] + xyxy[:, 2]) / 2
+        inside = (x_center[:, None] >= starts[None, :]) & (
+            x_center[:, None] < ends[None, :]
+        )
+        return np.where(inside.any(axis=1), inside.argmax(axis=1), -1)
+
+    def occupancy(self, zone_index):
+        """Jumlah box per zone (len(names),)."""
+        return np.bincount(zone_index[zone_index >= 0], minlength=len(self.names))
+
+    def describe(self, occupancy):
+        return " ".join(f"{name}:{count}" for name, count in zip(self.names, occupancy))
+
+
+def _to_numpy(xyxy):
+    """Terima array NumPy atau tensor (ultralytics) dan konversi satu kali."""
+    if hasattr(xyxy, "cpu"):
+        xyxy = xyxy.cpu().numpy()
+    return np.asarray(xyxy, dtype=np.float32)
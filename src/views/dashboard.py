@@ -1,4 +1,4 @@
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -8,6 +8,10 @@ from PyQt5.QtWidgets import (
 )
 
 from utils.icon import get_icon
+from utils.metrics import CpuLoad, performance_metrics, soc_temperature
+
+# Panel performa di-refresh dengan rate rendah agar tidak membebani pipeline
+PERFORMANCE_REFRESH_MS = 1000
 
 
 class DashboardCard(QFrame):
@@ -61,6 +65,83 @@ class DashboardCard(QFrame):
         self.clicked.emit()
 
 
+class PerformancePanel(QFrame):
+    """Metrik live pipeline (dari performance_metrics) + CPU load & suhu SoC."""
+
+    FIELDS = [
+        ("camera_fps", "Camera FPS"),
+        ("detection_fps", "Detection FPS"),
+        ("inference_ms", "Inference ms"),
+        ("dropped", "Dropped Frames"),
+        ("lidar_left_hz", "Lidar Left Hz"),
+        ("lidar_right_hz", "Lidar Right Hz"),
+        ("serial_sent", "Serial Sent"),
+        ("serial_skipped_busy", "Skipped (Busy)"),
+        ("cpu_percent", "CPU Load %"),
+        ("soc_temp", "SoC Temp °C"),
+    ]
+
+    def __init__(self):
+        super().__init__()
+
+        self.setObjectName("performancePanel")
+        self.setStyleSheet(
+            """
+            QFrame#performancePanel {
+                background-color: #1A1A1A;
+                border: 1px solid #242424;
+                border-radius: 20px;
+                padding: 16px;
+            }
+            QLabel {
+                color: #9A9A9A;
+                font-size: 12px;
+            }
+            QLabel#metricValue {
+                color: #EDEDED;
+                font-size: 18px;
+                font-weight: 600;
+            }
+        """
+        )
+
+        grid = QGridLayout()
+        grid.setSpacing(12)
+
+        self.values = {}
+        columns = 5
+        for index, (key, title) in enumerate(self.FIELDS):
+            value_label = QLabel("-")
+            value_label.setObjectName("metricValue")
+            value_label.setAlignment(Qt.AlignCenter)
+            title_label = QLabel(title)
+            title_label.setAlignment(Qt.AlignCenter)
+
+            row, column = divmod(index, columns)
+            grid.addWidget(value_label, row * 2, column)
+            grid.addWidget(title_label, row * 2 + 1, column)
+            self.values[key] = value_label
+
+        self.setLayout(grid)
+
+        self.cpu_load = CpuLoad()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(PERFORMANCE_REFRESH_MS)
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+
+        metrics = dict(performance_metrics.snapshot() or {})
+        metrics["cpu_percent"] = self.cpu_load.percent()
+        metrics["soc_temp"] = soc_temperature()
+
+        for key, label in self.values.items():
+            value = metrics.get(key)
+            label.setText("-" if value is None else str(value))
+
+
 class DashboardPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -87,6 +168,11 @@ class DashboardPage(QWidget):
         grid.addWidget(card_upgrade, 1, 1)
 
         layout.addLayout(grid)
+
+        # PERFORMANCE PANEL
+        self.performance_panel = PerformancePanel()
+        layout.addWidget(self.performance_panel)
+
         self.setLayout(layout)
 
         self.setStyleSheet("background-color: #0D0D0D;")
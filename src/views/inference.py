@@ -6,8 +6,8 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QSizePolicy,
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QGuiApplication, QPixmap
 
 from enums.log import LogLevel, LogSource
 from ui.button import Button
@@ -23,7 +23,11 @@ class InferencePage(QWidget):
         self.show_camera = True
         self.is_running = False
         self.yolo_thread = None
-        self.original_frame_size = None
+        self.pending_frame = None
+
+        # Frame terbaru digambar maksimal sekali per refresh layar
+        self.repaint_timer = QTimer(self)
+        self.repaint_timer.timeout.connect(self._paint_pending_frame)
         self._build_ui()
 
     def _build_ui(self):
@@ -151,7 +155,9 @@ class InferencePage(QWidget):
             self.yolo_thread.detection_ready.connect(self._append_log)
 
             self.yolo_thread.setup()
+            self.yolo_thread.set_display_size(*self._display_size())
             self.yolo_thread.start()
+            self.repaint_timer.start(self._refresh_interval())
 
             self._append_log("[INFO] Webcam initialized")
 
@@ -164,10 +170,14 @@ class InferencePage(QWidget):
 
     def stop_yolo(self):
         """Stop YOLO detection thread"""
+        self.repaint_timer.stop()
+        if self.pending_frame is not None:
+            self.pending_frame.release()
+            self.pending_frame = None
+
         if self.yolo_thread:
             self.yolo_thread.stop()
             self.yolo_thread = None
-            self.original_frame_size = None
 
         if self.show_camera:
             self.camera_label.clear()
@@ -175,39 +185,36 @@ class InferencePage(QWidget):
                 "Camera stopped\nClick 'Start' to begin inference"
             )
 
-    def display_frame(self, q_image):
-        if not self.show_camera or not self.is_running:
-            return
-
-        pixmap = QPixmap.fromImage(q_image)
-
-        if self.original_frame_size is None:
-            self.original_frame_size = pixmap.size()
-
-        scaled_pixmap = self.scale_pixmap_to_fit(pixmap)
-        self.camera_label.setPixmap(scaled_pixmap)
+    def display_frame(self, frame):
+        """Simpan frame terbaru; frame yang belum sempat digambar di-release."""
+        if self.pending_frame is not None:
+            self.pending_frame.release()
+        self.pending_frame = frame
 
-    def scale_pixmap_to_fit(self, pixmap):
-        container_size = self.camera_label.size()
-        pixmap_size = pixmap.size()
-
-        if container_size.width() <= 0 or container_size.height() <= 0:
-            return pixmap
-
-        if pixmap_size.width() <= 0 or pixmap_size.height() <= 0:
-            return pixmap
+    def _paint_pending_frame(self):
+        frame, self.pending_frame = self.pending_frame, None
+        if frame is None:
+            return
 
-        width_ratio = container_size.width() / pixmap_size.width()
-        height_ratio = container_size.height() / pixmap_size.height()
+        # QPixmap.fromImage menyalin pixel, setelah itu buffer dikembalikan ke pool
+        try:
+            if not self.show_camera or not self.is_running:
+                return
+            pixmap = QPixmap.fromImage(frame.image)
+        finally:
+            frame.release()
 
-        scale_ratio = min(width_ratio, height_ratio)
+        # Frame sudah di-resize ke ukuran label oleh render stage
+        self.camera_label.setPixmap(pixmap)
 
-        new_width = int(pixmap_size.width() * scale_ratio)
-        new_height = int(pixmap_size.height() * scale_ratio)
+    def _display_size(self):
+        size = self.camera_label.contentsRect().size()
+        return size.width(), size.height()
 
-        return pixmap.scaled(
-            new_width, new_height, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+    def _refresh_interval(self):
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen else 60.0
+        return max(1, int(1000 / (refresh_rate or 60.0)))
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -217,15 +224,10 @@ class InferencePage(QWidget):
         log_y = 20
         self.log_box.move(log_x, log_y)
 
-        if (
-            self.show_camera
-            and self.is_running
-            and hasattr(self.camera_label, "pixmap")
-            and self.camera_label.pixmap()
-        ):
-            current_pixmap = self.camera_label.pixmap()
-            scaled_pixmap = self.scale_pixmap_to_fit(current_pixmap)
-            self.camera_label.setPixmap(scaled_pixmap)
+        # Frame berikutnya dari render stage sudah berukuran baru; pixmap
+        # yang sedang tampil tidak di-scale ulang di GUI thread.
+        if self.yolo_thread:
+            self.yolo_thread.set_display_size(*self._display_size())
 
     def _append_log(self, text: str):
         """Append message to overlay log box."""
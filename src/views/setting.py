@@ -9,14 +9,19 @@ from PyQt5.QtWidgets import (
 )
 
 from configs.config_manager import ConfigManager
+from controller.engine import has_model
+from controller.model_registry import preload_configured_model
 from enums.log import LogLevel, LogSource
 from ui.button import Button
 from ui.dropdown import Dropdown
 from ui.input import InputForm
 from utils.logger import add_log
+from utils.profiler import memory_profiler, sampling_profiler
 from utils.serial import get_serial_ports
 from utils.icon import get_icon
 
+MODELS = ["small_tree", "medium_tree", "large_tree"]
+
 
 def detect_camera_indexes(max_test=5):
     import cv2
@@ -60,12 +65,9 @@ class SettingsPage(QWidget):
             items=detected_cameras,
         )
 
+        # Varian <name>_int8 (script/quantize.py) muncul jika sudah dibuat
         self.select_model = Dropdown(
-            items=[
-                "small_tree",
-                "medium_tree",
-                "large_tree",
-            ],
+            items=MODELS + [f"{m}_int8" for m in MODELS if has_model(f"{m}_int8")],
         )
 
         self.select_port = Dropdown(
@@ -86,6 +88,18 @@ class SettingsPage(QWidget):
             items=["0.5", "0.6", "0.7", "0.8"],
         )
 
+        self.select_backend = Dropdown(
+            items=["ultralytics", "ncnn", "onnxruntime", "openvino", "opencv"],
+        )
+
+        self.select_imgsz = Dropdown(
+            items=["320", "416", "480", "512", "640"],
+        )
+
+        self.select_capture_resolution = Dropdown(
+            items=["320x240", "640x480", "800x600", "1280x720", "1920x1080"],
+        )
+
         self.select_lidar_left = Dropdown(
             items=usb_ports,
         )
@@ -105,7 +119,7 @@ class SettingsPage(QWidget):
         grid.addWidget(QLabel("Camera Index:"), 1, 0, alignment=Qt.AlignRight)
         grid.addWidget(self.select_camera, 1, 1)
 
-        grid.addWidget(QLabel("FPS:"), 1, 2, alignment=Qt.AlignRight)
+        grid.addWidget(QLabel("Detection FPS:"), 1, 2, alignment=Qt.AlignRight)
         grid.addWidget(self.select_fps, 1, 3)
 
         ai_header = QLabel("AI")
@@ -118,32 +132,61 @@ class SettingsPage(QWidget):
         grid.addWidget(QLabel("Confidence:"), 3, 2, alignment=Qt.AlignRight)
         grid.addWidget(self.confidence, 3, 3)
 
+        grid.addWidget(QLabel("Inference Size:"), 4, 0, alignment=Qt.AlignRight)
+        grid.addWidget(self.select_imgsz, 4, 1)
+
+        grid.addWidget(QLabel("Capture Resolution:"), 4, 2, alignment=Qt.AlignRight)
+        grid.addWidget(self.select_capture_resolution, 4, 3)
+
+        grid.addWidget(QLabel("Backend:"), 5, 0, alignment=Qt.AlignRight)
+        grid.addWidget(self.select_backend, 5, 1)
+
         serial_header = QLabel("Serial")
         serial_header.setStyleSheet(
             "font-weight: bold; font-size: 14px; margin-top: 10px;"
         )
-        grid.addWidget(serial_header, 4, 0, 1, 4, alignment=Qt.AlignLeft)
+        grid.addWidget(serial_header, 6, 0, 1, 4, alignment=Qt.AlignLeft)
 
-        grid.addWidget(QLabel("Serial Port:"), 5, 0, alignment=Qt.AlignRight)
-        grid.addWidget(self.select_port, 5, 1)
+        grid.addWidget(QLabel("Serial Port:"), 7, 0, alignment=Qt.AlignRight)
+        grid.addWidget(self.select_port, 7, 1)
 
-        grid.addWidget(QLabel("Baudrate:"), 5, 2, alignment=Qt.AlignRight)
-        grid.addWidget(self.select_baudrate, 5, 3)
+        grid.addWidget(QLabel("Baudrate:"), 7, 2, alignment=Qt.AlignRight)
+        grid.addWidget(self.select_baudrate, 7, 3)
 
         lidar_header = QLabel("Lidar")
         lidar_header.setStyleSheet(
             "font-weight: bold; font-size: 14px; margin-top: 10px;"
         )
-        grid.addWidget(lidar_header, 6, 0, 1, 4)
+        grid.addWidget(lidar_header, 8, 0, 1, 4)
+
+        grid.addWidget(QLabel("Lidar Left Port:"), 9, 0, alignment=Qt.AlignRight)
+        grid.addWidget(self.select_lidar_left, 9, 1)
+
+        grid.addWidget(QLabel("Lidar Right Port:"), 9, 2, alignment=Qt.AlignRight)
+        grid.addWidget(self.select_lidar_right, 9, 3)
 
-        grid.addWidget(QLabel("Lidar Left Port:"), 7, 0, alignment=Qt.AlignRight)
-        grid.addWidget(self.select_lidar_left, 7, 1)
+        grid.addWidget(QLabel("Lidar Threshold:"), 10, 0, alignment=Qt.AlignRight)
+        grid.addWidget(self.select_lidar_threshold, 10, 1)
+
+        # Profiling runtime (tanpa restart), hasil ditulis ke logs/
+        profiling_header = QLabel("Profiling")
+        profiling_header.setStyleSheet(
+            "font-weight: bold; font-size: 14px; margin-top: 10px;"
+        )
+        grid.addWidget(profiling_header, 11, 0, 1, 4)
 
-        grid.addWidget(QLabel("Lidar Right Port:"), 7, 2, alignment=Qt.AlignRight)
-        grid.addWidget(self.select_lidar_right, 7, 3)
+        self.profile_button = Button(text="Start CPU Profile")
+        self.profile_button.clicked.connect(self._toggle_cpu_profile)
+        grid.addWidget(self.profile_button, 12, 1)
 
-        grid.addWidget(QLabel("Lidar Threshold:"), 8, 0, alignment=Qt.AlignRight)
-        grid.addWidget(self.select_lidar_threshold, 8, 1)
+        self.memory_button = Button(text="Start Memory Trace")
+        self.memory_button.clicked.connect(self._toggle_memory_trace)
+        grid.addWidget(self.memory_button, 12, 2)
+
+        self.snapshot_button = Button(text="Memory Snapshot")
+        self.snapshot_button.clicked.connect(self._memory_snapshot)
+        self.snapshot_button.setEnabled(memory_profiler.tracing)
+        grid.addWidget(self.snapshot_button, 12, 3)
 
         self.save_button = Button(
             text="Save Settings",
@@ -161,6 +204,37 @@ class SettingsPage(QWidget):
         layout.addStretch()
         self.setLayout(layout)
 
+    def _toggle_cpu_profile(self):
+        if not sampling_profiler.running:
+            sampling_profiler.start()
+            self.profile_button.setText("Stop CPU Profile")
+            return
+
+        path = sampling_profiler.stop()
+        self.profile_button.setText("Start CPU Profile")
+        self._profile_saved("CPU profile", path)
+
+    def _toggle_memory_trace(self):
+        if not memory_profiler.tracing:
+            memory_profiler.start()
+            self.memory_button.setText("Stop Memory Trace")
+            self.snapshot_button.setEnabled(True)
+            return
+
+        memory_profiler.stop()
+        self.memory_button.setText("Start Memory Trace")
+        self.snapshot_button.setEnabled(False)
+
+    def _memory_snapshot(self):
+        self._profile_saved("Memory snapshot", memory_profiler.snapshot())
+
+    def _profile_saved(self, name, path):
+        if not path:
+            return
+
+        add_log(LogLevel.INFO.value, LogSource.UI_SETTINGS.value, f"{name}: {path}")
+        QMessageBox.information(self, "Profiling", f"{name} disimpan di {path}")
+
     def _load_settings(self):
         cfg = self.configs.get_all()
 
@@ -182,6 +256,17 @@ class SettingsPage(QWidget):
         if "FPS" in cfg:
             self.select_fps.set_value(str(cfg["FPS"]))
 
+        if "YOLO_BACKEND" in cfg:
+            self.select_backend.set_value(cfg["YOLO_BACKEND"])
+
+        if "IMG_SIZE" in cfg:
+            self.select_imgsz.set_value(str(cfg["IMG_SIZE"]))
+
+        if "CAPTURE_WIDTH" in cfg and "CAPTURE_HEIGHT" in cfg:
+            self.select_capture_resolution.set_value(
+                f"{cfg['CAPTURE_WIDTH']}x{cfg['CAPTURE_HEIGHT']}"
+            )
+
         if "LIDAR_LEFT_PORT" in cfg:
             self.select_lidar_left.set_value(cfg["LIDAR_LEFT_PORT"])
 
@@ -199,6 +284,11 @@ class SettingsPage(QWidget):
             confidence = float(self.confidence.get_value())
             baudrate = int(self.select_baudrate.get_value())
             fps = int(self.select_fps.get_value())
+            backend = self.select_backend.get_value()
+            imgsz = int(self.select_imgsz.get_value())
+            capture_width, capture_height = map(
+                int, self.select_capture_resolution.get_value().split("x")
+            )
             lidar_left_port = self.select_lidar_left.get_value()
             lidar_right_port = self.select_lidar_right.get_value()
             lidar_threshold = int(self.select_lidar_threshold.get_value())
@@ -209,10 +299,16 @@ class SettingsPage(QWidget):
             self.configs.set_config("CONFIDENCE", confidence)
             self.configs.set_config("BAUDRATE", baudrate)
             self.configs.set_config("FPS", fps)
+            self.configs.set_config("YOLO_BACKEND", backend)
+            self.configs.set_config("IMG_SIZE", imgsz)
+            self.configs.set_config("CAPTURE_WIDTH", capture_width)
+            self.configs.set_config("CAPTURE_HEIGHT", capture_height)
             self.configs.set_config("LIDAR_LEFT_PORT", lidar_left_port)
             self.configs.set_config("LIDAR_RIGHT_PORT", lidar_right_port)
             self.configs.set_config("LIDAR_THRESHOLD", lidar_threshold)
 
+            preload_configured_model()
+
             QMessageBox.information(self, "Successful", "Berhasil disimpan")
 
             add_log(